@@ -1,11 +1,157 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
+import json
 import random
+import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
 
-import requests
+if TYPE_CHECKING:
+    import urllib.error
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder.
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    # orjson encodes dataclasses natively; the stdlib encoder needs them converted.
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if orjson is not None else 0
+
+
+def format_json(obj: Any) -> str:
+    """Pretty-print a response object for CLI output (2-space indent, sorted keys)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_PRETTY_OPTIONS).decode("utf-8")
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def print_json(obj: Any) -> None:
+    """Write `format_json(obj)` plus a newline to stdout.
+
+    With orjson the encoded bytes go straight to the binary buffer, skipping the
+    bytes -> str -> bytes round trip that `print` would add.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(format_json(obj))
+        return
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(obj, option=_PRETTY_OPTIONS | orjson.OPT_APPEND_NEWLINE))
+    buffer.flush()
+
+
+USER_AGENT = "OpenHands-DiscordSkill/1.0 (+https://github.com/OpenHands/skills)"
+
+# Shared by every request; callers add Authorization on top when needed.
+DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Content-Type": "application/json", "User-Agent": USER_AGENT}
+)
+
+
+@dataclass(frozen=True)
+class _HTTPResponse:
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+
+# Error bodies are only quoted (truncated to 500 bytes) in exceptions, so never buffer
+# more than this from a failed response.
+_ERROR_BODY_READ_LIMIT = 4096
+
+
+def _read_http_body(error: urllib.error.HTTPError) -> bytes:
+    try:
+        return error.read(_ERROR_BODY_READ_LIMIT)
+    except Exception:
+        return b""
+
+
+def _post_urllib(*, url: str, headers: Mapping[str, str], data: bytes, timeout_s: float) -> _HTTPResponse:
+    import urllib.error
+    import urllib.request
+
+    req = urllib.request.Request(url, data=data, headers=dict(headers), method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return _HTTPResponse(resp.status, resp.headers, resp.read())
+    except urllib.error.HTTPError as e:
+        return _HTTPResponse(e.code, e.headers, _read_http_body(e))
+
+
+_SESSION: Any = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> Any:
+    """Return the process-wide requests session, creating it on first use.
+
+    One keep-alive session lets retries and repeated posts to discord.com reuse the
+    pooled TLS connection instead of handshaking on every request.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+            _SESSION = session
+        return _SESSION
+
+
+def _post_requests(*, url: str, headers: Mapping[str, str], data: bytes, timeout_s: float) -> _HTTPResponse:
+    resp = _session().post(url, headers=headers, data=data, timeout=timeout_s, stream=True)
+    if resp.status_code >= 400 and resp.status_code != 429:
+        try:
+            content = next(resp.iter_content(chunk_size=_ERROR_BODY_READ_LIMIT), b"")
+        finally:
+            resp.close()
+    else:
+        content = resp.content
+    return _HTTPResponse(resp.status_code, resp.headers, content)
+
+
+@functools.cache
+def _backend() -> tuple[Callable[..., _HTTPResponse], tuple[type[Exception], ...]]:
+    """Pick the HTTP backend on first request so `import requests` stays off CLI startup.
+
+    Prefers requests; falls back to urllib from the stdlib when it isn't installed.
+    """
+    try:
+        import requests
+    except ImportError:
+        import http.client
+
+        return _post_urllib, (OSError, http.client.HTTPException)
+    return _post_requests, (requests.RequestException,)
 
 
 @dataclass(frozen=True)
@@ -17,111 +163,355 @@ class DiscordRateLimitInfo:
     reset_after: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class AllowedMentions:
+    """Discord `allowed_mentions` object. The default (`parse=()`) suppresses all pings."""
+
+    parse: tuple[str, ...] = ()
+
+
+NO_MENTIONS = AllowedMentions()
+ALL_MENTIONS = AllowedMentions(parse=("everyone", "roles", "users"))
+
+
+@dataclass(frozen=True, slots=True)
+class MessagePayload:
+    """Body for Execute Webhook / Create Message with plain text content."""
+
+    content: str
+    allowed_mentions: AllowedMentions = NO_MENTIONS
+
+
 class DiscordHTTPError(RuntimeError):
     pass
 
 
-def _parse_rate_limit_info(*, status_code: int, headers: Mapping[str, str], json_body: Any) -> DiscordRateLimitInfo | None:
-    if status_code != 429:
+_WEBHOOKS_MARKER = "/webhooks/"
+_REDACTED = "[redacted]"
+
+
+@functools.lru_cache(maxsize=64)
+def _webhook_token(url: str) -> str | None:
+    """Return the secret token segment of a `.../webhooks/{id}/{token}` URL, if any."""
+    start = url.find(_WEBHOOKS_MARKER)
+    if start == -1:
         return None
+    id_end = url.find("/", start + len(_WEBHOOKS_MARKER))
+    if id_end == -1:
+        return None
+    token_start = id_end + 1
+    token_end = min((i for i in (url.find(c, token_start) for c in "/?#") if i != -1), default=len(url))
+    return url[token_start:token_end] or None
 
-    retry_after: float | None = None
-    is_global = False
 
-    if isinstance(json_body, dict):
-        retry_after_val = json_body.get("retry_after")
-        if isinstance(retry_after_val, (int, float, str)):
-            try:
-                retry_after = float(retry_after_val)
-            except ValueError:
-                retry_after = None
-        is_global = bool(json_body.get("global", False))
-
-    if retry_after is None:
-        hdr = headers.get("Retry-After")
-        if hdr is not None:
-            try:
-                retry_after = float(hdr)
-            except ValueError:
-                retry_after = None
+@functools.lru_cache(maxsize=64)
+def _sanitize_url_for_logs(url: str) -> str:
+    token = _webhook_token(url)
+    return url.replace(token, _REDACTED) if token else url
 
-    if retry_after is None:
-        reset_after = headers.get("X-RateLimit-Reset-After")
-        if reset_after is not None:
-            try:
-                retry_after = float(reset_after)
-            except ValueError:
-                retry_after = None
 
-    if retry_after is None:
+def _redact_webhook_token(text: str, url: str) -> str:
+    token = _webhook_token(url)
+    return text.replace(token, _REDACTED) if token else text
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_rate_limit_info(*, status_code: int, headers: Mapping[str, str], body: bytes) -> DiscordRateLimitInfo | None:
+    # Checked before touching the body so non-429 responses never pay for a JSON parse.
+    if status_code != 429:
+        return None
+
+    json_body = _loads_or_none(body)
+    if not isinstance(json_body, dict):
+        json_body = {}
+
+    # First parseable source wins: JSON body, then the standard and Discord-specific headers.
+    for candidate in (
+        json_body.get("retry_after"),
+        headers.get("Retry-After"),
+        headers.get("X-RateLimit-Reset-After"),
+    ):
+        retry_after = _to_float(candidate)
+        if retry_after is not None:
+            break
+    else:
         return None
 
     return DiscordRateLimitInfo(
         retry_after=retry_after,
-        is_global=is_global,
+        is_global=bool(json_body.get("global", False)),
         bucket=headers.get("X-RateLimit-Bucket"),
         remaining=headers.get("X-RateLimit-Remaining"),
         reset_after=headers.get("X-RateLimit-Reset-After"),
     )
 
 
+def _send(
+    *,
+    url: str,
+    headers: Mapping[str, str],
+    data: bytes,
+    timeout_s: float,
+    redact_url_in_errors: bool,
+) -> _HTTPResponse:
+    do_post, transport_errors = _backend()
+    try:
+        return do_post(url=url, headers=headers, data=data, timeout_s=timeout_s)
+    except transport_errors as e:
+        if not redact_url_in_errors:
+            raise DiscordHTTPError(f"HTTP request failed ({e}).") from e
+        # Don't chain: the original exception's message embeds the full URL.
+        raise DiscordHTTPError(f"HTTP request failed ({_redact_webhook_token(str(e), url)}).") from None
+
+
+def _loads_or_none(raw: bytes) -> Any:
+    if not raw:
+        return None
+    try:
+        return json_loads(raw)
+    except ValueError:
+        return None
+
+
+def _retry_sleep_s(
+    rl: DiscordRateLimitInfo,
+    *,
+    attempt: int,
+    started_at: float,
+    max_retry_after_s: float,
+    jitter_s: float,
+    retry_budget_s: float,
+) -> float | None:
+    """How long to wait before retrying a 429, or None if the retry budget is spent.
+
+    Uses decorrelated jitter: never less than Discord's `retry_after`, but spread up to
+    `retry_after * 2**(attempt-1)` so clients sharing a bucket don't retry in lockstep.
+    """
+    retry_after = max(0.0, rl.retry_after)
+    sleep_s = min(random.uniform(retry_after, retry_after * 2 ** (attempt - 1)), max_retry_after_s)
+    if jitter_s > 0:
+        sleep_s += random.uniform(0.0, jitter_s)
+    if time.monotonic() - started_at + sleep_s > retry_budget_s:
+        return None
+    return sleep_s
+
+
+def _rate_limit_context(rl: DiscordRateLimitInfo) -> str:
+    return (
+        f" rate_limit_global={rl.is_global}"
+        + (f" rate_limit_bucket={rl.bucket}" if rl.bucket is not None else "")
+        + (f" rate_limit_remaining={rl.remaining}" if rl.remaining is not None else "")
+        + (f" rate_limit_reset_after={rl.reset_after}" if rl.reset_after is not None else "")
+    )
+
+
+def _result_or_raise(
+    resp: _HTTPResponse,
+    *,
+    rl: DiscordRateLimitInfo | None,
+    url: str,
+    redact_url_in_errors: bool,
+) -> dict[str, object] | None:
+    raw = resp.content
+    if resp.status_code >= 400:
+        shown_url = _sanitize_url_for_logs(url) if redact_url_in_errors else url
+        rl_context = _rate_limit_context(rl) if rl is not None else ""
+        response = f" Response: {raw[:500].decode('utf-8', errors='replace')}" if raw else ""
+        raise DiscordHTTPError(f"HTTP request failed (HTTP {resp.status_code}). url={shown_url}{rl_context}{response}")
+
+    # Only successful bodies are decoded; error bodies are just quoted in the message above.
+    if resp.status_code == 204 or not raw:
+        return None
+    json_body = _loads_or_none(raw)
+    if isinstance(json_body, dict):
+        return json_body
+    return {"raw": raw.decode("utf-8", errors="replace")}
+
+
 def post_json(
     *,
     url: str,
     headers: Mapping[str, str],
-    payload: Mapping[str, object],
+    payload: Mapping[str, object] | MessagePayload,
     timeout_s: float = 30,
     max_retries: int = 3,
     max_retry_after_s: float = 60.0,
     jitter_s: float = 0.25,
+    retry_budget_s: float = 120.0,
     redact_url_in_errors: bool = False,
 ) -> dict[str, object] | None:
+    data = json_dumps(payload)
+    if "Content-Type" not in headers:
+        headers = {"Content-Type": "application/json", **headers}
+
+    started_at = time.monotonic()
     attempt = 0
     while True:
         attempt += 1
-        try:
-            resp = requests.post(url, headers=dict(headers), json=dict(payload), timeout=timeout_s)
-        except requests.RequestException as e:
-            raise DiscordHTTPError(f"HTTP request failed ({e}).") from e
+        resp = _send(
+            url=url,
+            headers=headers,
+            data=data,
+            timeout_s=timeout_s,
+            redact_url_in_errors=redact_url_in_errors,
+        )
+        rl = _parse_rate_limit_info(status_code=resp.status_code, headers=resp.headers, body=resp.content)
+        if rl is not None and attempt <= max_retries:
+            sleep_s = _retry_sleep_s(
+                rl,
+                attempt=attempt,
+                started_at=started_at,
+                max_retry_after_s=max_retry_after_s,
+                jitter_s=jitter_s,
+                retry_budget_s=retry_budget_s,
+            )
+            if sleep_s is not None:
+                time.sleep(sleep_s)
+                continue
 
-        body_text = resp.text or ""
-        json_body: Any = None
-        if body_text:
-            try:
-                json_body = resp.json()
-            except ValueError:
-                json_body = None
+        return _result_or_raise(resp, rl=rl, url=url, redact_url_in_errors=redact_url_in_errors)
+
+
+class RateLimitGate:
+    """Shared "not before" deadline for async posts that hit the same rate-limit bucket.
+
+    When one post gets a 429, every post waiting on the gate holds off until the
+    bucket resets instead of spending its own request on another 429.
+    """
+
+    def __init__(self) -> None:
+        self._not_before = 0.0
+
+    def hold(self, delay_s: float) -> None:
+        self._not_before = max(self._not_before, time.monotonic() + delay_s)
 
-        rl = _parse_rate_limit_info(status_code=resp.status_code, headers=resp.headers, json_body=json_body)
+    async def wait(self) -> None:
+        import asyncio
+
+        while (delay_s := self._not_before - time.monotonic()) > 0:
+            await asyncio.sleep(delay_s)
+
+
+async def post_json_async(
+    *,
+    url: str,
+    headers: Mapping[str, str],
+    payload: Mapping[str, object] | MessagePayload,
+    timeout_s: float = 30,
+    max_retries: int = 3,
+    max_retry_after_s: float = 60.0,
+    jitter_s: float = 0.25,
+    retry_budget_s: float = 120.0,
+    redact_url_in_errors: bool = False,
+    gate: RateLimitGate | None = None,
+) -> dict[str, object] | None:
+    """Async counterpart of `post_json` with the same retry/429 semantics.
+
+    The blocking request runs in a worker thread (sharing the pooled session) and
+    rate-limit waits are awaited, so a 429 on one post doesn't stall unrelated ones.
+    Pass a shared `gate` to make posts to the same bucket back off together.
+    """
+    import asyncio  # Deferred: only batch callers pay for importing asyncio.
+
+    data = json_dumps(payload)
+    if "Content-Type" not in headers:
+        headers = {"Content-Type": "application/json", **headers}
+    if gate is None:
+        gate = RateLimitGate()
+
+    started_at = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        await gate.wait()
+        resp = await asyncio.to_thread(
+            _send,
+            url=url,
+            headers=headers,
+            data=data,
+            timeout_s=timeout_s,
+            redact_url_in_errors=redact_url_in_errors,
+        )
+        rl = _parse_rate_limit_info(status_code=resp.status_code, headers=resp.headers, body=resp.content)
         if rl is not None and attempt <= max_retries:
-            sleep_s = min(max(0.0, rl.retry_after), max_retry_after_s)
-            if jitter_s > 0:
-                sleep_s += random.uniform(0.0, jitter_s)
-            time.sleep(sleep_s)
-            continue
-
-        if resp.status_code >= 400:
-            context_bits: list[str] = []
-            if not redact_url_in_errors:
-                context_bits.append(f"url={url}")
-            if rl is not None:
-                context_bits.append(f"rate_limit_global={rl.is_global}")
-                if rl.bucket is not None:
-                    context_bits.append(f"rate_limit_bucket={rl.bucket}")
-                if rl.remaining is not None:
-                    context_bits.append(f"rate_limit_remaining={rl.remaining}")
-                if rl.reset_after is not None:
-                    context_bits.append(f"rate_limit_reset_after={rl.reset_after}")
-
-            context = (" " + " ".join(context_bits)) if context_bits else ""
-
-            msg = f"HTTP request failed (HTTP {resp.status_code}).{context}"
-            if body_text:
-                msg += f" Response: {body_text[:500]}"
-            raise DiscordHTTPError(msg)
-
-        if not body_text:
-            return None
-        if isinstance(json_body, dict):
-            return json_body
-        return {"raw": body_text}
+            sleep_s = _retry_sleep_s(
+                rl,
+                attempt=attempt,
+                started_at=started_at,
+                max_retry_after_s=max_retry_after_s,
+                jitter_s=jitter_s,
+                retry_budget_s=retry_budget_s,
+            )
+            if sleep_s is not None:
+                gate.hold(sleep_s)
+                continue
+
+        return _result_or_raise(resp, rl=rl, url=url, redact_url_in_errors=redact_url_in_errors)
+
+
+async def post_json_batch(
+    *,
+    url: str,
+    headers: Mapping[str, str],
+    payloads: Sequence[Mapping[str, object] | MessagePayload],
+    concurrency: int = 1,
+    on_success: Callable[[int, dict[str, object] | None], None] | None = None,
+    **kwargs: Any,
+) -> list[dict[str, object] | None | DiscordHTTPError]:
+    """Post several payloads to the same URL, at most `concurrency` in flight at once.
+
+    All posts share one `RateLimitGate`, since they hit the same Discord bucket.
+    Results are returned in the same order as `payloads`; a post that fails leaves
+    its `DiscordHTTPError` in its slot instead of cancelling the others. With the
+    default `concurrency=1` messages are delivered in order; higher values may
+    reorder them. `on_success(index, result)` is called as soon as each post
+    succeeds. Keyword arguments are forwarded to `post_json_async`.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    gate = RateLimitGate()
+
+    async def _post_one(
+        index: int, payload: Mapping[str, object] | MessagePayload
+    ) -> dict[str, object] | None | DiscordHTTPError:
+        async with semaphore:
+            try:
+                result = await post_json_async(url=url, headers=headers, payload=payload, gate=gate, **kwargs)
+            except DiscordHTTPError as e:
+                return e
+        if on_success is not None:
+            on_success(index, result)
+        return result
+
+    return list(await asyncio.gather(*(_post_one(i, p) for i, p in enumerate(payloads))))
+
+
+def print_batch_results(results: Sequence[dict[str, object] | None | DiscordHTTPError]) -> int:
+    """Print `post_json_batch` results and return the CLI exit code.
+
+    Failed posts are reported on stderr and shown as `{"error": ...}` in the JSON
+    output, so the ids of messages that did go out are never lost.
+    """
+    failed = 0
+    shown: list[object] = []
+    for i, result in enumerate(results, 1):
+        if isinstance(result, DiscordHTTPError):
+            failed += 1
+            print(f"Message {i} failed: {result}", file=sys.stderr)
+            shown.append({"error": str(result)})
+        else:
+            shown.append(result)
+
+    if any(r is not None for r in shown):
+        print_json(shown)
+    if failed:
+        print(f"{failed} of {len(results)} messages failed.", file=sys.stderr)
+        return 1
+    return 0
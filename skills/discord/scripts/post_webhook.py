@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
 import os
 import sys
+import tempfile
 import urllib.parse
-import urllib.request
+from pathlib import Path
 
-from ._http import DiscordHTTPError, post_json
+from ._http import (
+    DEFAULT_HEADERS,
+    DiscordHTTPError,
+    MessagePayload,
+    json_dumps,
+    json_loads,
+    post_json,
+    post_json_batch,
+    print_batch_results,
+    print_json,
+)
+
+_CACHE_MISS = object()
 
 
 def _with_wait_param(url: str, *, wait: bool) -> str:
     if not wait:
         return url
 
+    if "#" not in url and "wait=" not in url:
+        # Common case: appending the flag is enough, no need to parse and rebuild the URL.
+        sep = "" if url.endswith(("?", "&")) else ("&" if "?" in url else "?")
+        return f"{url}{sep}wait=true"
+
     parts = urllib.parse.urlsplit(url)
     query = dict(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
     query["wait"] = "true"
@@ -25,22 +43,113 @@ def _with_wait_param(url: str, *, wait: bool) -> str:
     )
 
 
-def _request_json(url: str, payload: dict[str, object], *, wait: bool, max_retries: int) -> dict[str, object] | None:
-    request_url = _with_wait_param(url, wait=wait)
+def _payload(content: str) -> MessagePayload:
+    return MessagePayload(content=content)
+
+
+def _cache_dir() -> Path:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "openhands-discord" / "webhook"
+
+
+def _cache_path(url: str, payload: MessagePayload) -> Path:
+    # The key is a hash, so the webhook token in `url` never reaches the filesystem.
+    key = hashlib.sha256(url.encode("utf-8") + b"\0" + json_dumps(payload)).hexdigest()
+    return _cache_dir() / f"{key}.json"
+
 
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "OpenHands-DiscordSkill/1.0 (+https://github.com/OpenHands/skills)",
-    }
+def _read_cached(path: Path) -> object:
+    try:
+        entry = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return _CACHE_MISS
+    if not isinstance(entry, dict) or "result" not in entry:
+        return _CACHE_MISS
+    return entry["result"]
 
-    return post_json(
-        url=request_url,
-        headers=headers,
+
+def _write_cached(path: Path, result: dict[str, object] | None) -> None:
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps({"result": result}))
+        os.replace(tmp, path)
+    except OSError as e:
+        # The message was delivered; failing to record it only costs a duplicate on a later rerun.
+        print(f"Warning: could not write idempotency cache: {e}", file=sys.stderr)
+
+
+def _request_json(
+    url: str,
+    payload: MessagePayload,
+    *,
+    wait: bool,
+    max_retries: int,
+    idempotent: bool = False,
+) -> dict[str, object] | None:
+    url = _with_wait_param(url, wait=wait)
+
+    cache_path = _cache_path(url, payload) if idempotent else None
+    if cache_path is not None:
+        cached = _read_cached(cache_path)
+        if cached is not _CACHE_MISS:
+            return cached  # type: ignore[return-value]
+
+    result = post_json(
+        url=url,
+        headers=DEFAULT_HEADERS,
         payload=payload,
         max_retries=max_retries,
         redact_url_in_errors=True,
     )
 
+    if cache_path is not None:
+        _write_cached(cache_path, result)
+    return result
+
+
+def _request_json_batch(
+    url: str,
+    payloads: list[MessagePayload],
+    *,
+    wait: bool,
+    max_retries: int,
+    concurrency: int,
+    idempotent: bool = False,
+) -> list[dict[str, object] | None | DiscordHTTPError]:
+    import asyncio  # Only --batch needs an event loop.
+
+    url = _with_wait_param(url, wait=wait)
+
+    results: list[object] = [_CACHE_MISS] * len(payloads)
+    cache_paths = [_cache_path(url, p) for p in payloads] if idempotent else []
+    for i, path in enumerate(cache_paths):
+        results[i] = _read_cached(path)
+
+    pending = [i for i, r in enumerate(results) if r is _CACHE_MISS]
+
+    def _remember(j: int, result: dict[str, object] | None) -> None:
+        # Record each delivery right away, so a later failure or crash can't lose it.
+        _write_cached(cache_paths[pending[j]], result)
+
+    if pending:
+        posted = asyncio.run(
+            post_json_batch(
+                url=url,
+                headers=DEFAULT_HEADERS,
+                payloads=[payloads[i] for i in pending],
+                concurrency=concurrency,
+                on_success=_remember if idempotent else None,
+                max_retries=max_retries,
+                redact_url_in_errors=True,
+            )
+        )
+        for i, result in zip(pending, posted):
+            results[i] = result
+
+    return results  # type: ignore[return-value]
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -69,6 +178,25 @@ def main() -> int:
         default=3,
         help="Retries on HTTP 429 (default: 3).",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read stdin as one message per non-empty line and post each of them.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum in-flight posts in --batch mode (default: 1, in order). Values above 1 may reorder messages.",
+    )
+    parser.add_argument(
+        "--idempotent",
+        action="store_true",
+        help=(
+            "Skip messages already posted successfully with the same webhook URL and payload, "
+            "so rerunning a job does not post duplicates. Uses $XDG_CACHE_HOME/openhands-discord."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -76,6 +204,27 @@ def main() -> int:
         print("Missing --webhook-url (or set DISCORD_WEBHOOK_URL).", file=sys.stderr)
         return 2
 
+    if args.batch:
+        if args.content is not None:
+            print("--batch reads messages from stdin; do not combine it with --content.", file=sys.stderr)
+            return 2
+
+        contents = [line.strip() for line in sys.stdin if line.strip()]
+        if not contents:
+            print("No content provided on stdin.", file=sys.stderr)
+            return 2
+
+        results = _request_json_batch(
+            args.webhook_url,
+            [_payload(c) for c in contents],
+            wait=args.wait,
+            max_retries=max(0, args.max_retries),
+            concurrency=args.concurrency,
+            idempotent=args.idempotent,
+        )
+
+        return print_batch_results(results)
+
     content = args.content
     if content is None:
         content = sys.stdin.read().strip()
@@ -84,20 +233,16 @@ def main() -> int:
         print("No content provided (use --content or stdin).", file=sys.stderr)
         return 2
 
-    payload = {
-        "content": content,
-        "allowed_mentions": {"parse": []},
-    }
-
     result = _request_json(
         args.webhook_url,
-        payload,
+        _payload(content),
         wait=args.wait,
         max_retries=max(0, args.max_retries),
+        idempotent=args.idempotent,
     )
 
     if result is not None:
-        print(json.dumps(result, indent=2, sort_keys=True))
+        print_json(result)
 
     return 0
 
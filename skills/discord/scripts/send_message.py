@@ -3,38 +3,88 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import os
 import sys
-import urllib.request
-
-from ._http import DiscordHTTPError, post_json
+from types import MappingProxyType
+from typing import Mapping
+
+from ._http import (
+    ALL_MENTIONS,
+    DEFAULT_HEADERS,
+    NO_MENTIONS,
+    DiscordHTTPError,
+    MessagePayload,
+    post_json,
+    post_json_batch,
+    print_batch_results,
+    print_json,
+)
 
 
 API_BASE = "https://discord.com/api/v10"
 
 
+@functools.lru_cache(maxsize=4)
+def _headers(token: str) -> Mapping[str, str]:
+    # Read-only so the cached mapping can be shared safely between calls.
+    return MappingProxyType({"Authorization": f"Bot {token}", **DEFAULT_HEADERS})
+
+
+@functools.lru_cache(maxsize=32)
+def _messages_url(channel_id: str) -> str:
+    return f"{API_BASE}/channels/{channel_id}/messages"
+
+
+def _payload(content: str, *, allow_mentions: bool) -> MessagePayload:
+    return MessagePayload(content=content, allowed_mentions=ALL_MENTIONS if allow_mentions else NO_MENTIONS)
+
+
 def _post_message(
     *,
     token: str,
     channel_id: str,
-    payload: dict[str, object],
+    payload: MessagePayload,
     max_retries: int,
 ) -> dict[str, object] | None:
-    url = f"{API_BASE}/channels/{channel_id}/messages"
-
-    headers = {
-        "Authorization": f"Bot {token}",
-        "Content-Type": "application/json",
-        "User-Agent": "OpenHands-DiscordSkill/1.0 (+https://github.com/OpenHands/skills)",
-    }
-
     try:
-        return post_json(url=url, headers=headers, payload=payload, max_retries=max_retries)
+        return post_json(
+            url=_messages_url(channel_id),
+            headers=_headers(token),
+            payload=payload,
+            max_retries=max_retries,
+        )
     except DiscordHTTPError as e:
         raise DiscordHTTPError(f"Discord API call failed. channel_id={channel_id}. {e}") from e
 
 
+def _post_messages(
+    *,
+    token: str,
+    channel_id: str,
+    payloads: list[MessagePayload],
+    max_retries: int,
+    concurrency: int,
+) -> list[dict[str, object] | None | DiscordHTTPError]:
+    import asyncio
+
+    results = asyncio.run(
+        post_json_batch(
+            url=_messages_url(channel_id),
+            headers=_headers(token),
+            payloads=payloads,
+            concurrency=concurrency,
+            max_retries=max_retries,
+        )
+    )
+    return [
+        DiscordHTTPError(f"Discord API call failed. channel_id={channel_id}. {r}")
+        if isinstance(r, DiscordHTTPError)
+        else r
+        for r in results
+    ]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Send a message to a Discord channel using a bot token.")
     parser.add_argument(
@@ -62,6 +112,17 @@ def main() -> int:
         action="store_true",
         help="Allow Discord to parse mentions. Default is safe (no mentions).",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read stdin as one message per non-empty line and send each of them.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum in-flight requests in --batch mode (default: 1, in order). Values above 1 may reorder messages.",
+    )
 
     args = parser.parse_args()
 
@@ -73,6 +134,26 @@ def main() -> int:
         print("Missing --channel-id (or set DISCORD_CHANNEL_ID).", file=sys.stderr)
         return 2
 
+    if args.batch:
+        if args.content is not None:
+            print("--batch reads messages from stdin; do not combine it with --content.", file=sys.stderr)
+            return 2
+
+        contents = [line.strip() for line in sys.stdin if line.strip()]
+        if not contents:
+            print("No content provided on stdin.", file=sys.stderr)
+            return 2
+
+        results = _post_messages(
+            token=args.token,
+            channel_id=args.channel_id,
+            payloads=[_payload(c, allow_mentions=args.allow_mentions) for c in contents],
+            max_retries=max(0, args.max_retries),
+            concurrency=args.concurrency,
+        )
+
+        return print_batch_results(results)
+
     content = args.content
     if content is None:
         content = sys.stdin.read().strip()
@@ -81,19 +162,15 @@ def main() -> int:
         print("No content provided (use --content or stdin).", file=sys.stderr)
         return 2
 
-    payload: dict[str, object] = {"content": content}
-    if not args.allow_mentions:
-        payload["allowed_mentions"] = {"parse": []}
-
     result = _post_message(
         token=args.token,
         channel_id=args.channel_id,
-        payload=payload,
+        payload=_payload(content, allow_mentions=args.allow_mentions),
         max_retries=max(0, args.max_retries),
     )
 
     if result is not None:
-        print(json.dumps(result, indent=2, sort_keys=True))
+        print_json(result)
 
     return 0
 
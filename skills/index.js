@@ -134,7 +134,7 @@ export const SKILLS_CATALOG = [
       "discord.js",
       "discord.py"
     ],
-    "content": "# Discord\n\nUse this skill when implementing or automating Discord integrations.\n\n## Pick the right approach\n\n1. **Incoming webhooks (best for one-way posting)**\n   - Good for CI notifications, alerts, build status, etc.\n   - No bot user needed.\n   - See: https://discord.com/developers/docs/resources/webhook#execute-webhook\n\n2. **Bot token + REST API (two-way / richer automation)**\n   - Use when you need to post as a bot, manage channels, read history, moderate, etc.\n   - REST API base: `https://discord.com/api/v10`\n   - Most REST calls use `Authorization: Bot <token>`.\n\n3. **Interactions / slash commands (user-invoked commands)**\n   - Use application commands and interaction webhooks.\n   - Typically requires running a web server to receive interactions and respond quickly.\n\n## Secrets & safety\n\n- **Never hard-code tokens**. Use environment variables:\n  - `DISCORD_WEBHOOK_URL` for incoming webhooks\n  - `DISCORD_BOT_TOKEN` for bot REST API calls\n- Treat webhook URLs as secrets (they include a token).\n- Do **not** automate normal user accounts (“self-bots”). Use official bot/OAuth flows.\n\n## Footguns / safety notes (read this)\n\n- **Webhook URLs are secrets** (the token is embedded in the URL). Don’t paste them into issues, logs, CI output, or chat.\n- **Mentions are dangerous by default**: always set `allowed_mentions` to something strict (these examples use `{\"parse\": []}`) to avoid accidentally pinging `@everyone` / roles.\n- **Watch for accidental secret logging**:\n  - If you build your own scripts, avoid including full webhook URLs in exception messages.\n  - The bundled scripts sanitize webhook URLs in error output, but you should still avoid printing the URL yourself.\n- **Rate limits**: handle HTTP 429 with `retry_after`/`Retry-After`, and don’t retry forever.\n\n## Quick recipes\n\nThe shell snippets below use POSIX-style environment variables and line continuations. On Windows PowerShell, use `curl.exe` for the shown flags and `$env:DISCORD_WEBHOOK_URL` / `$env:DISCORD_BOT_TOKEN` for environment variables, or translate the request to `Invoke-RestMethod`.\n\n### Post a message via an incoming webhook (recommended)\n\nDiscord requires at least one of `content`, `embeds`, `components`, `file`, or `poll`.\n\n```bash\ncurl -sS -X POST \\\n  -H 'Content-Type: application/json' \\\n  -d '{\"content\":\"Hello from OpenHands\",\"allowed_mentions\":{\"parse\":[]}}' \\\n  \"$DISCORD_WEBHOOK_URL\"\n```\n\n### Post a message to a channel with a bot token\n\nEndpoint: `POST /channels/{channel_id}/messages` (Create Message)\n\n```bash\nCHANNEL_ID=\"...\"\n\ncurl -sS -X POST \"https://discord.com/api/v10/channels/${CHANNEL_ID}/messages\" \\\n  -H \"Authorization: Bot $DISCORD_BOT_TOKEN\" \\\n  -H 'Content-Type: application/json' \\\n  -d '{\"content\":\"Hello from my bot\",\"allowed_mentions\":{\"parse\":[]}}'\n```\n\nDocs: https://discord.com/developers/docs/resources/channel#create-message\n\n## Automation scripts (bundled)\n\nThese scripts are self-contained and only use the Python standard library.\n\n- Post to a webhook:\n  ```bash\n  python3 -m skills.discord.scripts.post_webhook --content \"Build finished\" --wait\n  ```\n\n- Post to a channel using a bot token:\n  ```bash\n  python3 -m skills.discord.scripts.send_message --channel-id \"$CHANNEL_ID\" --content \"Hello\"\n  ```\n\n## Rate limits\n\n- Don’t hard-code limits. Use Discord’s `Retry-After` / `retry_after` and rate-limit headers when present.\n- On HTTP **429**, wait for the provided delay (clamp to a sane maximum, add small jitter), then retry.\n\nDocs: https://discord.com/developers/docs/topics/rate-limits\n\n## Slash commands / application commands\n\n- Use **guild commands** for fast iteration (instant updates).\n- Use **global commands** when ready; propagation can take longer.\n\nDocs: https://discord.com/developers/docs/interactions/application-commands\n\n## Reference\n\nFor more details (OAuth2 flows, command registration endpoints, troubleshooting), see:\n- [references/REFERENCE.md](references/REFERENCE.md)"
+    "content": "# Discord\n\nUse this skill when implementing or automating Discord integrations.\n\n## Pick the right approach\n\n1. **Incoming webhooks (best for one-way posting)**\n   - Good for CI notifications, alerts, build status, etc.\n   - No bot user needed.\n   - See: https://discord.com/developers/docs/resources/webhook#execute-webhook\n\n2. **Bot token + REST API (two-way / richer automation)**\n   - Use when you need to post as a bot, manage channels, read history, moderate, etc.\n   - REST API base: `https://discord.com/api/v10`\n   - Most REST calls use `Authorization: Bot <token>`.\n\n3. **Interactions / slash commands (user-invoked commands)**\n   - Use application commands and interaction webhooks.\n   - Typically requires running a web server to receive interactions and respond quickly.\n\n## Secrets & safety\n\n- **Never hard-code tokens**. Use environment variables:\n  - `DISCORD_WEBHOOK_URL` for incoming webhooks\n  - `DISCORD_BOT_TOKEN` for bot REST API calls\n- Treat webhook URLs as secrets (they include a token).\n- Do **not** automate normal user accounts (“self-bots”). Use official bot/OAuth flows.\n\n## Footguns / safety notes (read this)\n\n- **Webhook URLs are secrets** (the token is embedded in the URL). Don’t paste them into issues, logs, CI output, or chat.\n- **Mentions are dangerous by default**: always set `allowed_mentions` to something strict (these examples use `{\"parse\": []}`) to avoid accidentally pinging `@everyone` / roles.\n- **Watch for accidental secret logging**:\n  - If you build your own scripts, avoid including full webhook URLs in exception messages.\n  - The bundled scripts sanitize webhook URLs in error output, but you should still avoid printing the URL yourself.\n- **Rate limits**: handle HTTP 429 with `retry_after`/`Retry-After`, and don’t retry forever.\n\n## Quick recipes\n\nThe shell snippets below use POSIX-style environment variables and line continuations. On Windows PowerShell, use `curl.exe` for the shown flags and `$env:DISCORD_WEBHOOK_URL` / `$env:DISCORD_BOT_TOKEN` for environment variables, or translate the request to `Invoke-RestMethod`.\n\n### Post a message via an incoming webhook (recommended)\n\nDiscord requires at least one of `content`, `embeds`, `components`, `file`, or `poll`.\n\n```bash\ncurl -sS -X POST \\\n  -H 'Content-Type: application/json' \\\n  -d '{\"content\":\"Hello from OpenHands\",\"allowed_mentions\":{\"parse\":[]}}' \\\n  \"$DISCORD_WEBHOOK_URL\"\n```\n\n### Post a message to a channel with a bot token\n\nEndpoint: `POST /channels/{channel_id}/messages` (Create Message)\n\n```bash\nCHANNEL_ID=\"...\"\n\ncurl -sS -X POST \"https://discord.com/api/v10/channels/${CHANNEL_ID}/messages\" \\\n  -H \"Authorization: Bot $DISCORD_BOT_TOKEN\" \\\n  -H 'Content-Type: application/json' \\\n  -d '{\"content\":\"Hello from my bot\",\"allowed_mentions\":{\"parse\":[]}}'\n```\n\nDocs: https://discord.com/developers/docs/resources/channel#create-message\n\n## Automation scripts (bundled)\n\nThese scripts are self-contained and run on the Python standard library alone. When installed, `requests` is used for pooled keep-alive connections and `orjson` for faster JSON encoding/decoding.\n\n- Post to a webhook:\n  ```bash\n  python3 -m skills.discord.scripts.post_webhook --content \"Build finished\" --wait\n  ```\n\n- Post to a channel using a bot token:\n  ```bash\n  python3 -m skills.discord.scripts.send_message --channel-id \"$CHANNEL_ID\" --content \"Hello\"\n  ```\n\n- Post several messages at once (one per stdin line). They go out in order by default; `--concurrency N` keeps up to N in flight but may reorder them. If some posts fail, the others still go out: failures are listed on stderr and as `{\"error\": ...}` entries in the output, and the exit code is 1.\n  ```bash\n  printf 'Build 1 finished\\nBuild 2 finished\\n' | python3 -m skills.discord.scripts.post_webhook --batch --wait\n  ```\n\n- Make reruns safe (e.g. a retried CI job): with `--idempotent`, a message that was already posted successfully with the same webhook URL and payload is not sent again; the stored response is printed instead. Entries live under `$XDG_CACHE_HOME/openhands-discord/` (default `~/.cache`), named by a hash so the webhook token is never written to disk. Delete that directory to reset.\n  ```bash\n  python3 -m skills.discord.scripts.post_webhook --content \"Release v1.2.0 published\" --idempotent\n  ```\n\n## Rate limits\n\n- Don’t hard-code limits. Use Discord’s `Retry-After` / `retry_after` and rate-limit headers when present.\n- On HTTP **429**, wait for the provided delay (clamp to a sane maximum, add small jitter), then retry.\n\nDocs: https://discord.com/developers/docs/topics/rate-limits\n\n## Slash commands / application commands\n\n- Use **guild commands** for fast iteration (instant updates).\n- Use **global commands** when ready; propagation can take longer.\n\nDocs: https://discord.com/developers/docs/interactions/application-commands\n\n## Reference\n\nFor more details (OAuth2 flows, command registration endpoints, troubleshooting), see:\n- [references/REFERENCE.md](references/REFERENCE.md)"
   },
   {
     "name": "docker",
@@ -328,7 +328,7 @@ export const SKILLS_CATALOG = [
       "oh-api-v1",
       "oh-cloud-api-v1"
     ],
-    "content": "This skill documents the **OpenHands Cloud API** (V1), commonly used **agent-server APIs**, and small, easy-to-copy clients.\nWindows PowerShell equivalents for the shell examples in this skill are in `references/windows.md`.\n\nIt is intentionally focused on common OpenHands API workflows:\n\n- Defaults to OpenHands Cloud (`https://app.all-hands.dev`).\n- Targets the **V1 app server REST API** under `/api/v1/...`.\n- Includes a few **agent server** endpoints (inside a sandbox) that use `X-Session-API-Key`.\n- Covers the **multi-conversation delegation pattern**: start separate Cloud conversations when you want fresh context windows or background work.\n- Covers **local Agent Canvas backend conversations**: start or inspect conversations by calling a local agent server directly.\n\n## When to use this skill\n\nUse this skill when you need to:\n\n- start or inspect OpenHands Cloud conversations from code\n- monitor async startup via start-task polling\n- monitor execution status for long-running jobs\n- create separate Cloud conversations for parallel or background work\n- access sandbox agent-server endpoints once a conversation is running\n- start or inspect conversations on a local Agent Canvas backend or local agent server\n\n## Auth\n\n### App server (Cloud)\n\nUse Bearer auth:\n\n- Header: `Authorization: Bearer <OPENHANDS_CLOUD_API_KEY>`\n- Preferred env var: `OPENHANDS_CLOUD_API_KEY`\n- Backward-compatible env var: `OPENHANDS_API_KEY`\n\n### Agent server (inside a sandbox)\n\nUse session auth:\n\n- Header: `X-Session-API-Key: <session_api_key>`\n\nHow to obtain `agent_server_url` and `session_api_key`:\n\n1. Start or fetch an app conversation via the app server (Bearer auth), e.g.:\n   - `POST /api/v1/app-conversations`\n   - or `GET /api/v1/app-conversations?ids=<conversation_id>`\n2. In the returned JSON, look for sandbox/runtime connection fields (names vary slightly by deployment/version). Common patterns:\n   - a sandbox object containing `agent_server_url` (or similar)\n   - a session key such as `session_api_key` (or similar)\n3. Use those values to call the agent server directly:\n   - Base: `{agent_server_url}/api/...`\n   - Header: `X-Session-API-Key: <session_api_key>`\n\nExample (common field names; adjust to your deployment):\n\n```python\n# using the minimal Python client (`OpenHandsAPI`)\nconv = api.app_conversation_get(app_conversation_id)\n\nsession_api_key = conv.get(\"session_api_key\")\nconversation_url = conv.get(\"conversation_url\", \"\")\n\n# `conversation_url` often looks like: https://<runtime-host>/api/conversations/<id>\nagent_server_url = conversation_url.rsplit(\"/api/conversations\", 1)[0]\n```\n\n\nIf those fields are not present on the conversation record, list/search sandboxes (`GET /api/v1/sandboxes/search`) and use the sandbox referenced by the conversation to locate the agent server URL + session key.\n\n### Local Agent Canvas backend\n\nUse the local backend flow only for local Agent Canvas / agent-server development, such as `agent-canvas`, `agent-canvas --backend-only`, or `npm run dev` with ingress at `http://localhost:8000`. This calls the agent server directly with `X-Session-API-Key`. It is not an automation, and it is different from OpenHands Cloud delegation through `POST /api/v1/app-conversations`, which uses Bearer auth against the Cloud app API and may return asynchronous start-task records.\n\nWhen Agent Canvas runs locally, the launcher uses `LOCAL_BACKEND_API_KEY` when it is set. Otherwise it generates and persists the session API key at `~/.openhands/agent-canvas/api-key.txt`. Set `OH_SESSION_API_KEY_PATH` to override the persisted key path. Never print, log, or paste the actual key; use command substitution or an environment variable in examples and scripts.\n\n```bash\nLOCAL_AGENT_SERVER_URL=\"${LOCAL_AGENT_SERVER_URL:-http://localhost:8000}\"\nSESSION_API_KEY=\"${LOCAL_BACKEND_API_KEY:-$(cat \"${OH_SESSION_API_KEY_PATH:-$HOME/.openhands/agent-canvas/api-key.txt}\")}\"\n```\n\nCheck the local server before creating a backend conversation:\n\n```bash\ncurl -sS \"${LOCAL_AGENT_SERVER_URL}/server_info\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\"\n```\n\nStart a backend conversation with `POST /api/conversations`. Include the agent settings and workspace expected by that backend. Local agent-server calls use an explicit `workspace` such as `{\"kind\": \"LocalWorkspace\", \"working_dir\": \"/workspace\"}`; Cloud app-conversation delegation instead uses app-server fields such as `selected_repository` and `selected_branch`. If you are starting the conversation from an existing Agent Canvas session, pass through the current configured settings or encrypted settings rather than hard-coding secrets into scripts.\n\n```bash\nCONVERSATION_JSON=$(curl -sS -X POST \"${LOCAL_AGENT_SERVER_URL}/api/conversations\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\" \\\n  -H \"Content-Type: application/json\" \\\n  -d @- <<'JSON'\n{\n  \"agent\": {\n    \"kind\": \"Agent\",\n    \"llm\": {\n      \"model\": \"your-model-provider/your-model-name\",\n      \"api_key\": \"**********\"\n    },\n    \"tools\": [\n      {\"name\": \"terminal\"},\n      {\"name\": \"file_editor\"},\n      {\"name\": \"task_tracker\"}\n    ]\n  },\n  \"workspace\": {\"kind\": \"LocalWorkspace\", \"working_dir\": \"/workspace\"},\n  \"initial_message\": {\n    \"content\": [{\"text\": \"Summarize the current workspace.\"}],\n    \"run\": true\n  }\n}\nJSON\n)\nCONVERSATION_ID=$(python3 -c 'import json,sys; print(json.load(sys.stdin)[\"id\"])' <<<\"${CONVERSATION_JSON}\")\nprintf 'Conversation: %s/api/conversations/%s\\n' \"${LOCAL_AGENT_SERVER_URL}\" \"${CONVERSATION_ID}\"\n```\n\nPoll status and inspect recent events:\n\n```bash\ncurl -sS \"${LOCAL_AGENT_SERVER_URL}/api/conversations/${CONVERSATION_ID}\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\"\n\ncurl -sS \"${LOCAL_AGENT_SERVER_URL}/api/conversations/${CONVERSATION_ID}/events/search?limit=20&sort_order=TIMESTAMP_DESC\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\"\n```\n\nIf the same base URL serves the Agent Canvas UI, the browser route is:\n\n```bash\nprintf '%s/conversations/%s\\n' \"${LOCAL_AGENT_SERVER_URL}\" \"${CONVERSATION_ID}\"\n```\n\n## Common V1 app server endpoints\n\nThe following are the main endpoints implemented in the minimal client:\n\n- `GET /api/v1/users/me` — validate auth and inspect current account\n- `GET /api/v1/app-conversations/search?limit=...` — list recent conversations\n- `GET /api/v1/app-conversations?ids=...` — fetch conversation records by id (batch)\n- `GET /api/v1/app-conversations/count` — count conversations\n- `POST /api/v1/app-conversations` — start a new conversation (creates a sandbox)\n- `GET /api/v1/app-conversations/start-tasks?ids=...` — check async start-task status\n- `GET /api/v1/conversation/{app_conversation_id}/events/search?limit=...` — read conversation events\n- `GET /api/v1/conversation/{app_conversation_id}/events/count` — count events\n- `GET /api/v1/sandboxes/search?limit=...` — list sandboxes\n- `POST /api/v1/sandboxes/{sandbox_id}/pause` / `.../resume` — manage sandbox lifecycle\n- `GET /api/v1/app-conversations/{app_conversation_id}/download` — download trajectory zip\n\n## Delegating work with additional Cloud conversations\n\nUse the Cloud API when you want a **separate OpenHands conversation** with its own fresh context window.\nThis is useful for:\n\n- background jobs that can run independently\n- parallel investigations or implementation tasks\n- long-running work where you want to keep the current conversation focused\n- task-specific contexts, such as one conversation building a component while another runs tests\n\n### Delegation checklist\n\nWhen you start a delegated Cloud conversation:\n\n1. Write a **self-contained task description**. Do not assume the new conversation has any context from the current one.\n2. Include the **repository**, branch, relevant file paths, constraints, and expected output.\n3. Start the new conversation with `POST /api/v1/app-conversations`.\n4. Poll the start-task until `status` is `READY` and you have an `app_conversation_id`.\n5. Monitor the delegated conversation via `GET /api/v1/app-conversations?ids=...`.\n6. Share or store the Cloud URL: `https://app.all-hands.dev/conversations/<app_conversation_id>`.\n\n### Minimal cURL flow\n\n```bash\ncurl -X POST \"https://app.all-hands.dev/api/v1/app-conversations\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY}\" \\\n  -H \"Content-Type: application/json\" \\\n  -d '{\n    \"initial_message\": {\n      \"content\": [{\"type\": \"text\", \"text\": \"Investigate flaky tests in tests/test_api.py. Report the root cause and propose a fix.\"}]\n    },\n    \"selected_repository\": \"owner/repo\"\n  }'\n```\n\nIf the response does not already include `app_conversation_id`, poll the start-task:\n\n```bash\ncurl -s \"https://app.all-hands.dev/api/v1/app-conversations/start-tasks?ids=${START_TASK_ID}\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY}\"\n```\n\nThen check execution status:\n\n```bash\ncurl -s \"https://app.all-hands.dev/api/v1/app-conversations?ids=${APP_CONVERSATION_ID}\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY}\"\n```\n\n### Minimal Python flow\n\n```python\nfrom openhands_api import OpenHandsAPI\n\napi = OpenHandsAPI()  # prefers OPENHANDS_CLOUD_API_KEY\n\nstart = api.app_conversation_start(\n    initial_message=(\n        \"Implement the requested dashboard component in src/dashboard.tsx. \"\n        \"Update any related tests and summarize the changes.\"\n    ),\n    selected_repository=\"owner/repo\",\n    selected_branch=\"main\",\n    title=\"Dashboard component task\",\n)\n\nready = start\nif not ready.get(\"app_conversation_id\"):\n    ready = api.poll_start_task_until_ready(start[\"id\"])\n\nconversation_id = ready[\"app_conversation_id\"]\nprint(f\"Delegated conversation: {api.base_url}/conversations/{conversation_id}\")\n\nstatus = api.app_conversation_get(conversation_id)\nprint(status.get(\"sandbox_status\"), status.get(\"execution_status\"))\n\napi.close()\n```\n\n### Parallelism guidance\n\n- Prefer **5 or fewer** concurrently running delegated conversations.\n- Before starting more, check recent conversations and count how many are still `execution_status == \"running\"`.\n- Batch specific conversation lookups with `GET /api/v1/app-conversations?ids=...` when you already know their ids.\n\nExample:\n\n```python\nitems = api.app_conversations_search(limit=50).get(\"items\", [])\nrunning = [item for item in items if item.get(\"execution_status\") == \"running\"]\nif len(running) >= 5:\n    print(\"Wait for some delegated conversations to finish before starting more.\")\n```\n\n\n### Start-task vs `app_conversation_id` (common pitfall)\n\nIn many deployments, `POST /api/v1/app-conversations` is **asynchronous** and returns a **start-task** object:\n\n- `id` is the **start_task_id**\n- `app_conversation_id` is the id you should use for conversation operations like:\n  - `GET /api/v1/app-conversations/{app_conversation_id}/download`\n  - `GET /api/v1/conversation/{app_conversation_id}/events/...`\n\nIf `app_conversation_id` is not present in the initial response, fetch it via:\n\n- `GET /api/v1/app-conversations/start-tasks?ids=<start_task_id>`\n\nIf you pass a **start_task_id** to `/download`, you will get `404 Not Found`.\n\n## Common agent server endpoints\n\nThese run against `agent_server_url` (not the app server):\n\n- `POST {agent_server_url}/api/bash/execute_bash_command`\n- `GET  {agent_server_url}/api/file/download/<absolute_path>`\n- `POST {agent_server_url}/api/file/upload/<absolute_path>` (multipart)\n- `GET  {agent_server_url}/api/conversations/{conversation_id}/events/search`\n- `GET  {agent_server_url}/api/conversations/{conversation_id}/events/count`\n\n### Counting events (recommended approach)\n\nIf you need to know how many events a conversation has, you can:\n\n1. **App server count (fastest when working)**\n   - `GET /api/v1/conversation/{app_conversation_id}/events/count`\n2. **Agent server count (reliable fallback)**\n   - `GET {agent_server_url}/api/conversations/{app_conversation_id}/events/count`\n3. **Trajectory zip fallback (heavier, but still one call + gives full payloads)**\n   - `GET /api/v1/app-conversations/{app_conversation_id}/download`\n   - Unzip and count `event_*.json` files\n\nDo **not** rely on the last event `id` to infer the total number of events.\nIn the agent-server API, event IDs are UUIDs (not monotonically increasing integers).\n\n## Troubleshooting\n\nFor common issues and solutions, see [TROUBLESHOOTING.md](references/TROUBLESHOOTING.md).\n\n## Event structure (for debugging)\n\nEvents returned by:\n\n- app server: `GET /api/v1/conversation/{id}/events/search`\n- agent server: `GET {agent_server_url}/api/conversations/{id}/events/search`\n\n…share the same high-level shape.\n\nEach event typically includes:\n\n- `id` (UUID)\n- `timestamp`\n- `kind`\n- `source`\n\nCommon `kind` values:\n\n| kind | source (typical) | key fields (common) | purpose |\n|---|---|---|---|\n| `ActionEvent` | `agent` | `tool_name`, `tool_call_id`, `action` | tool call requested by the agent |\n| `ObservationEvent` | `environment` | `tool_name`, `tool_call_id`, `action_id`, `observation` | tool result produced by the sandbox/environment |\n| `MessageEvent` | `user` / `assistant` | `message` (or similar) | user/assistant chat messages |\n| `ConversationStateUpdateEvent` | `environment` | `key`, `value` | state transitions/metadata |\n\nLinking tool calls:\n\n- `ActionEvent.tool_call_id` == `ObservationEvent.tool_call_id`\n- `ObservationEvent.action_id` == `ActionEvent.id`\n\nExample (simplified):\n\n```json\n{\n  \"id\": \"<action-event-uuid>\",\n  \"kind\": \"ActionEvent\",\n  \"source\": \"agent\",\n  \"tool_name\": \"terminal\",\n  \"tool_call_id\": \"toolu_...\",\n  \"action\": {\"command\": \"ls\"}\n}\n```\n\n```json\n{\n  \"id\": \"<observation-event-uuid>\",\n  \"kind\": \"ObservationEvent\",\n  \"source\": \"environment\",\n  \"tool_name\": \"terminal\",\n  \"tool_call_id\": \"toolu_...\",\n  \"action_id\": \"<action-event-uuid>\",\n  \"observation\": {\"exit_code\": 0, \"stdout\": \"...\"}\n}\n```\n\n## Debugging one-liners (events)\n\nThese assume you're querying the **app server** endpoint. For agent-server queries, swap the URL base + use `X-Session-API-Key`.\n\n### Print a quick timeline\n\n```bash\ncurl -s \"${BASE_URL:-https://app.all-hands.dev}/api/v1/conversation/${APP_CONVERSATION_ID}/events/search?limit=100\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY:-$OPENHANDS_API_KEY}\" \\\n  -H \"Accept: application/json\" | \\\npython3 - <<'PY'\nimport json, sys\nitems = (json.load(sys.stdin) or {}).get(\"items\", [])\nfor i, e in enumerate(items):\n    print(f\"{i:04d}  {e.get('timestamp','')}  {e.get('source','')}  {e.get('kind','')}\")\nPY\n```\n\n### Find error-like events\n\n```bash\ncurl -s \"${BASE_URL:-https://app.all-hands.dev}/api/v1/conversation/${APP_CONVERSATION_ID}/events/search?limit=200\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY:-$OPENHANDS_API_KEY}\" \\\n  -H \"Accept: application/json\" | \\\npython3 - <<'PY'\nimport json, sys\nitems = (json.load(sys.stdin) or {}).get(\"items\", [])\nfor i, e in enumerate(items):\n    if e.get(\"kind\") == \"ErrorEvent\" or (\"code\" in e and \"detail\" in e):\n        print(i, e.get(\"kind\"), e.get(\"code\"), str(e.get(\"detail\", \"\"))[:400])\nPY\n```\n\n### Check tool-call matching (unmatched actions / duplicate observations)\n\n```bash\ncurl -s \"${BASE_URL:-https://app.all-hands.dev}/api/v1/conversation/${APP_CONVERSATION_ID}/events/search?limit=200\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY:-$OPENHANDS_API_KEY}\" \\\n  -H \"Accept: application/json\" | \\\npython3 - <<'PY'\nimport json, sys\nfrom collections import Counter\nitems = (json.load(sys.stdin) or {}).get(\"items\", [])\naction_ids = {e.get(\"id\") for e in items if e.get(\"kind\") == \"ActionEvent\"}\nobs_action_ids = [e.get(\"action_id\") for e in items if e.get(\"kind\") == \"ObservationEvent\" and e.get(\"action_id\")]\nobserved = set(obs_action_ids)\nprint(\"actions:\", len(action_ids))\nprint(\"observations:\", len(observed))\nunmatched = action_ids - observed\nprint(\"unmatched actions:\", list(unmatched)[:20] if unmatched else \"none\")\ndups = [aid for aid, c in Counter(obs_action_ids).items() if c > 1]\nprint(\"duplicate observation action_ids:\", list(dups)[:20] if dups else \"none\")\nPY\n```\n\n\n## Quick start (Python)\n\n```python\n# Copy `skills/openhands-api/scripts/openhands_api.py` into your project (e.g. as `openhands_api.py`),\n# then import it normally:\nfrom openhands_api import OpenHandsAPI\n\napi = OpenHandsAPI()  # prefers OPENHANDS_CLOUD_API_KEY\n\nme = api.users_me()\nprint(me)\n\nrecent = api.app_conversations_search(limit=5)\nprint(recent)\n\napi.close()\n```\n\n## CLI examples\n\nSearch conversations:\n\n```bash\nexport OPENHANDS_CLOUD_API_KEY=\"...\"\npython skills/openhands-api/scripts/openhands_api.py search-conversations --limit 5\n```\n\nStart a conversation from a prompt file:\n\n```bash\npython skills/openhands-api/scripts/openhands_api.py start-conversation \\\n  --prompt-file skills/openhands-api/references/example_prompt.md \\\n  --repo owner/repo \\\n  --branch main\n```\n\n## Notes for AI agents extending this client\n\n- Prefer `.../search` endpoints with a small `limit`.\n- Avoid loops that could generate many API calls.\n- Start conversations only when asked: it may create sandboxes and cost money.\n- For sandbox file operations and command execution, use the agent server endpoints with `X-Session-API-Key`.\n\nSee also:\n- `skills/openhands-api/scripts/openhands_api.py`\n- The original inspiration client: `enyst/llm-playground` → `openhands-api-client-v1/scripts/cloud_api_v1.py`\n- Troubleshooting content and real-world usage feedback → `https://github.com/jpshackelford/.openhands/tree/main/skills/openhands-cloud-api`\n\n## Source of truth\n\nThis skill is aligned against the current OpenHands API docs and implementation:\n\n- `OpenHands/docs/openhands/usage/cloud/cloud-api.mdx`\n- `OpenHands/docs/openhands/usage/agent-canvas/backend-setup/local.mdx`\n- `OpenHands/docs/sdk/arch/agent-server.mdx`\n- `OpenHands/docs/openhands/usage/api/v1.mdx`\n- `OpenHands/OpenHands/openhands/app_server/v1_router.py`\n- `OpenHands/OpenHands/openhands/app_server/app_conversation/app_conversation_router.py`\n- `OpenHands/OpenHands/openhands/app_server/app_conversation/app_conversation_models.py`"
+    "content": "This skill documents the **OpenHands Cloud API** (V1), commonly used **agent-server APIs**, and small, easy-to-copy clients.\nWindows PowerShell equivalents for the shell examples in this skill are in `references/windows.md`.\n\nIt is intentionally focused on common OpenHands API workflows:\n\n- Defaults to OpenHands Cloud (`https://app.all-hands.dev`).\n- Targets the **V1 app server REST API** under `/api/v1/...`.\n- Includes a few **agent server** endpoints (inside a sandbox) that use `X-Session-API-Key`.\n- Covers the **multi-conversation delegation pattern**: start separate Cloud conversations when you want fresh context windows or background work.\n- Covers **local Agent Canvas backend conversations**: start or inspect conversations by calling a local agent server directly.\n\n## When to use this skill\n\nUse this skill when you need to:\n\n- start or inspect OpenHands Cloud conversations from code\n- monitor async startup via start-task polling\n- monitor execution status for long-running jobs\n- create separate Cloud conversations for parallel or background work\n- access sandbox agent-server endpoints once a conversation is running\n- start or inspect conversations on a local Agent Canvas backend or local agent server\n\n## Auth\n\n### App server (Cloud)\n\nUse Bearer auth:\n\n- Header: `Authorization: Bearer <OPENHANDS_CLOUD_API_KEY>`\n- Preferred env var: `OPENHANDS_CLOUD_API_KEY`\n- Backward-compatible env var: `OPENHANDS_API_KEY`\n\n### Agent server (inside a sandbox)\n\nUse session auth:\n\n- Header: `X-Session-API-Key: <session_api_key>`\n\nHow to obtain `agent_server_url` and `session_api_key`:\n\n1. Start or fetch an app conversation via the app server (Bearer auth), e.g.:\n   - `POST /api/v1/app-conversations`\n   - or `GET /api/v1/app-conversations?ids=<conversation_id>`\n2. In the returned JSON, look for sandbox/runtime connection fields (names vary slightly by deployment/version). Common patterns:\n   - a sandbox object containing `agent_server_url` (or similar)\n   - a session key such as `session_api_key` (or similar)\n3. Use those values to call the agent server directly:\n   - Base: `{agent_server_url}/api/...`\n   - Header: `X-Session-API-Key: <session_api_key>`\n\nExample (common field names; adjust to your deployment):\n\n```python\n# using the minimal Python client (`OpenHandsAPI`)\nconv = api.app_conversation_get(app_conversation_id)\n\nsession_api_key = conv.get(\"session_api_key\")\nconversation_url = conv.get(\"conversation_url\", \"\")\n\n# `conversation_url` often looks like: https://<runtime-host>/api/conversations/<id>\nagent_server_url = conversation_url.rsplit(\"/api/conversations\", 1)[0]\n```\n\n\nIf those fields are not present on the conversation record, list/search sandboxes (`GET /api/v1/sandboxes/search`) and use the sandbox referenced by the conversation to locate the agent server URL + session key.\n\n### Local Agent Canvas backend\n\nUse the local backend flow only for local Agent Canvas / agent-server development, such as `agent-canvas`, `agent-canvas --backend-only`, or `npm run dev` with ingress at `http://localhost:8000`. This calls the agent server directly with `X-Session-API-Key`. It is not an automation, and it is different from OpenHands Cloud delegation through `POST /api/v1/app-conversations`, which uses Bearer auth against the Cloud app API and may return asynchronous start-task records.\n\nWhen Agent Canvas runs locally, the launcher uses `LOCAL_BACKEND_API_KEY` when it is set. Otherwise it generates and persists the session API key at `~/.openhands/agent-canvas/api-key.txt`. Set `OH_SESSION_API_KEY_PATH` to override the persisted key path. Never print, log, or paste the actual key; use command substitution or an environment variable in examples and scripts.\n\n```bash\nLOCAL_AGENT_SERVER_URL=\"${LOCAL_AGENT_SERVER_URL:-http://localhost:8000}\"\nSESSION_API_KEY=\"${LOCAL_BACKEND_API_KEY:-$(cat \"${OH_SESSION_API_KEY_PATH:-$HOME/.openhands/agent-canvas/api-key.txt}\")}\"\n```\n\nCheck the local server before creating a backend conversation:\n\n```bash\ncurl -sS \"${LOCAL_AGENT_SERVER_URL}/server_info\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\"\n```\n\nStart a backend conversation with `POST /api/conversations`. Include the agent settings and workspace expected by that backend. Local agent-server calls use an explicit `workspace` such as `{\"kind\": \"LocalWorkspace\", \"working_dir\": \"/workspace\"}`; Cloud app-conversation delegation instead uses app-server fields such as `selected_repository` and `selected_branch`. If you are starting the conversation from an existing Agent Canvas session, pass through the current configured settings or encrypted settings rather than hard-coding secrets into scripts.\n\n```bash\nCONVERSATION_JSON=$(curl -sS -X POST \"${LOCAL_AGENT_SERVER_URL}/api/conversations\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\" \\\n  -H \"Content-Type: application/json\" \\\n  -d @- <<'JSON'\n{\n  \"agent\": {\n    \"kind\": \"Agent\",\n    \"llm\": {\n      \"model\": \"your-model-provider/your-model-name\",\n      \"api_key\": \"**********\"\n    },\n    \"tools\": [\n      {\"name\": \"terminal\"},\n      {\"name\": \"file_editor\"},\n      {\"name\": \"task_tracker\"}\n    ]\n  },\n  \"workspace\": {\"kind\": \"LocalWorkspace\", \"working_dir\": \"/workspace\"},\n  \"initial_message\": {\n    \"content\": [{\"text\": \"Summarize the current workspace.\"}],\n    \"run\": true\n  }\n}\nJSON\n)\nCONVERSATION_ID=$(python3 -c 'import json,sys; print(json.load(sys.stdin)[\"id\"])' <<<\"${CONVERSATION_JSON}\")\nprintf 'Conversation: %s/api/conversations/%s\\n' \"${LOCAL_AGENT_SERVER_URL}\" \"${CONVERSATION_ID}\"\n```\n\nPoll status and inspect recent events:\n\n```bash\ncurl -sS \"${LOCAL_AGENT_SERVER_URL}/api/conversations/${CONVERSATION_ID}\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\"\n\ncurl -sS \"${LOCAL_AGENT_SERVER_URL}/api/conversations/${CONVERSATION_ID}/events/search?limit=20&sort_order=TIMESTAMP_DESC\" \\\n  -H \"X-Session-API-Key: ${SESSION_API_KEY}\"\n```\n\nIf the same base URL serves the Agent Canvas UI, the browser route is:\n\n```bash\nprintf '%s/conversations/%s\\n' \"${LOCAL_AGENT_SERVER_URL}\" \"${CONVERSATION_ID}\"\n```\n\n## Common V1 app server endpoints\n\nThe following are the main endpoints implemented in the minimal client:\n\n- `GET /api/v1/users/me` — validate auth and inspect current account\n- `GET /api/v1/app-conversations/search?limit=...` — list recent conversations\n- `GET /api/v1/app-conversations?ids=...` — fetch conversation records by id (batch)\n- `GET /api/v1/app-conversations/count` — count conversations\n- `POST /api/v1/app-conversations` — start a new conversation (creates a sandbox)\n- `GET /api/v1/app-conversations/start-tasks?ids=...` — check async start-task status\n- `GET /api/v1/conversation/{app_conversation_id}/events/search?limit=...` — read conversation events (pass `page_id=<next_page_id>` for the next page; the Python client's `iter_conversation_events()` does this for you)\n- `GET /api/v1/conversation/{app_conversation_id}/events/count` — count events\n- `GET /api/v1/sandboxes/search?limit=...` — list sandboxes\n- `POST /api/v1/sandboxes/{sandbox_id}/pause` / `.../resume` — manage sandbox lifecycle\n- `GET /api/v1/app-conversations/{app_conversation_id}/download` — download trajectory zip\n\n## Delegating work with additional Cloud conversations\n\nUse the Cloud API when you want a **separate OpenHands conversation** with its own fresh context window.\nThis is useful for:\n\n- background jobs that can run independently\n- parallel investigations or implementation tasks\n- long-running work where you want to keep the current conversation focused\n- task-specific contexts, such as one conversation building a component while another runs tests\n\n### Delegation checklist\n\nWhen you start a delegated Cloud conversation:\n\n1. Write a **self-contained task description**. Do not assume the new conversation has any context from the current one.\n2. Include the **repository**, branch, relevant file paths, constraints, and expected output.\n3. Start the new conversation with `POST /api/v1/app-conversations`.\n4. Poll the start-task until `status` is `READY` and you have an `app_conversation_id`.\n5. Monitor the delegated conversation via `GET /api/v1/app-conversations?ids=...`.\n6. Share or store the Cloud URL: `https://app.all-hands.dev/conversations/<app_conversation_id>`.\n\n### Minimal cURL flow\n\n```bash\ncurl -X POST \"https://app.all-hands.dev/api/v1/app-conversations\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY}\" \\\n  -H \"Content-Type: application/json\" \\\n  -d '{\n    \"initial_message\": {\n      \"content\": [{\"type\": \"text\", \"text\": \"Investigate flaky tests in tests/test_api.py. Report the root cause and propose a fix.\"}]\n    },\n    \"selected_repository\": \"owner/repo\"\n  }'\n```\n\nIf the response does not already include `app_conversation_id`, poll the start-task:\n\n```bash\ncurl -s \"https://app.all-hands.dev/api/v1/app-conversations/start-tasks?ids=${START_TASK_ID}\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY}\"\n```\n\nThen check execution status:\n\n```bash\ncurl -s \"https://app.all-hands.dev/api/v1/app-conversations?ids=${APP_CONVERSATION_ID}\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY}\"\n```\n\n### Minimal Python flow\n\n```python\nfrom openhands_api import OpenHandsAPI\n\napi = OpenHandsAPI()  # prefers OPENHANDS_CLOUD_API_KEY\n\nstart = api.app_conversation_start(\n    initial_message=(\n        \"Implement the requested dashboard component in src/dashboard.tsx. \"\n        \"Update any related tests and summarize the changes.\"\n    ),\n    selected_repository=\"owner/repo\",\n    selected_branch=\"main\",\n    title=\"Dashboard component task\",\n)\n\nready = start\nif not ready.get(\"app_conversation_id\"):\n    ready = api.poll_start_task_until_ready(start[\"id\"])\n\nconversation_id = ready[\"app_conversation_id\"]\nprint(f\"Delegated conversation: {api.base_url}/conversations/{conversation_id}\")\n\nstatus = api.app_conversation_get(conversation_id)\nprint(status.get(\"sandbox_status\"), status.get(\"execution_status\"))\n\napi.close()\n```\n\n### Parallelism guidance\n\n- Prefer **5 or fewer** concurrently running delegated conversations.\n- Before starting more, check recent conversations and count how many are still `execution_status == \"running\"`.\n- Batch specific conversation lookups with `GET /api/v1/app-conversations?ids=...` when you already know their ids.\n\nExample:\n\n```python\nitems = api.app_conversations_search(limit=50).get(\"items\", [])\nrunning = [item for item in items if item.get(\"execution_status\") == \"running\"]\nif len(running) >= 5:\n    print(\"Wait for some delegated conversations to finish before starting more.\")\n```\n\n\n### Start-task vs `app_conversation_id` (common pitfall)\n\nIn many deployments, `POST /api/v1/app-conversations` is **asynchronous** and returns a **start-task** object:\n\n- `id` is the **start_task_id**\n- `app_conversation_id` is the id you should use for conversation operations like:\n  - `GET /api/v1/app-conversations/{app_conversation_id}/download`\n  - `GET /api/v1/conversation/{app_conversation_id}/events/...`\n\nIf `app_conversation_id` is not present in the initial response, fetch it via:\n\n- `GET /api/v1/app-conversations/start-tasks?ids=<start_task_id>`\n\nIf you pass a **start_task_id** to `/download`, you will get `404 Not Found`.\n\n## Common agent server endpoints\n\nThese run against `agent_server_url` (not the app server):\n\n- `POST {agent_server_url}/api/bash/execute_bash_command`\n- `GET  {agent_server_url}/api/file/download/<absolute_path>`\n- `POST {agent_server_url}/api/file/upload/<absolute_path>` (multipart)\n- `GET  {agent_server_url}/api/conversations/{conversation_id}/events/search`\n- `GET  {agent_server_url}/api/conversations/{conversation_id}/events/count`\n\n### Counting events (recommended approach)\n\nIf you need to know how many events a conversation has, you can:\n\n1. **App server count (fastest when working)**\n   - `GET /api/v1/conversation/{app_conversation_id}/events/count`\n2. **Agent server count (reliable fallback)**\n   - `GET {agent_server_url}/api/conversations/{app_conversation_id}/events/count`\n3. **Trajectory zip fallback (heavier, but still one call + gives full payloads)**\n   - `GET /api/v1/app-conversations/{app_conversation_id}/download`\n   - Unzip and count `event_*.json` files\n\nDo **not** rely on the last event `id` to infer the total number of events.\nIn the agent-server API, event IDs are UUIDs (not monotonically increasing integers).\n\nThe same applies to paging: to read a whole event log, follow the `next_page_id` cursor returned by `.../events/search` (pass it back as `page_id`) rather than an id offset. The Python client wraps this as `iter_conversation_events()` (app server) and `iter_agent_events()` (agent server).\n\n## Troubleshooting\n\nFor common issues and solutions, see [TROUBLESHOOTING.md](references/TROUBLESHOOTING.md).\n\n## Event structure (for debugging)\n\nEvents returned by:\n\n- app server: `GET /api/v1/conversation/{id}/events/search`\n- agent server: `GET {agent_server_url}/api/conversations/{id}/events/search`\n\n…share the same high-level shape.\n\nEach event typically includes:\n\n- `id` (UUID)\n- `timestamp`\n- `kind`\n- `source`\n\nCommon `kind` values:\n\n| kind | source (typical) | key fields (common) | purpose |\n|---|---|---|---|\n| `ActionEvent` | `agent` | `tool_name`, `tool_call_id`, `action` | tool call requested by the agent |\n| `ObservationEvent` | `environment` | `tool_name`, `tool_call_id`, `action_id`, `observation` | tool result produced by the sandbox/environment |\n| `MessageEvent` | `user` / `assistant` | `message` (or similar) | user/assistant chat messages |\n| `ConversationStateUpdateEvent` | `environment` | `key`, `value` | state transitions/metadata |\n\nLinking tool calls:\n\n- `ActionEvent.tool_call_id` == `ObservationEvent.tool_call_id`\n- `ObservationEvent.action_id` == `ActionEvent.id`\n\nExample (simplified):\n\n```json\n{\n  \"id\": \"<action-event-uuid>\",\n  \"kind\": \"ActionEvent\",\n  \"source\": \"agent\",\n  \"tool_name\": \"terminal\",\n  \"tool_call_id\": \"toolu_...\",\n  \"action\": {\"command\": \"ls\"}\n}\n```\n\n```json\n{\n  \"id\": \"<observation-event-uuid>\",\n  \"kind\": \"ObservationEvent\",\n  \"source\": \"environment\",\n  \"tool_name\": \"terminal\",\n  \"tool_call_id\": \"toolu_...\",\n  \"action_id\": \"<action-event-uuid>\",\n  \"observation\": {\"exit_code\": 0, \"stdout\": \"...\"}\n}\n```\n\n## Debugging one-liners (events)\n\nThese assume you're querying the **app server** endpoint. For agent-server queries, swap the URL base + use `X-Session-API-Key`.\n\n### Print a quick timeline\n\n```bash\ncurl -s \"${BASE_URL:-https://app.all-hands.dev}/api/v1/conversation/${APP_CONVERSATION_ID}/events/search?limit=100\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY:-$OPENHANDS_API_KEY}\" \\\n  -H \"Accept: application/json\" | \\\npython3 - <<'PY'\nimport json, sys\nitems = (json.load(sys.stdin) or {}).get(\"items\", [])\nfor i, e in enumerate(items):\n    print(f\"{i:04d}  {e.get('timestamp','')}  {e.get('source','')}  {e.get('kind','')}\")\nPY\n```\n\n### Find error-like events\n\n```bash\ncurl -s \"${BASE_URL:-https://app.all-hands.dev}/api/v1/conversation/${APP_CONVERSATION_ID}/events/search?limit=200\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY:-$OPENHANDS_API_KEY}\" \\\n  -H \"Accept: application/json\" | \\\npython3 - <<'PY'\nimport json, sys\nitems = (json.load(sys.stdin) or {}).get(\"items\", [])\nfor i, e in enumerate(items):\n    if e.get(\"kind\") == \"ErrorEvent\" or (\"code\" in e and \"detail\" in e):\n        print(i, e.get(\"kind\"), e.get(\"code\"), str(e.get(\"detail\", \"\"))[:400])\nPY\n```\n\n### Check tool-call matching (unmatched actions / duplicate observations)\n\n```bash\ncurl -s \"${BASE_URL:-https://app.all-hands.dev}/api/v1/conversation/${APP_CONVERSATION_ID}/events/search?limit=200\" \\\n  -H \"Authorization: Bearer ${OPENHANDS_CLOUD_API_KEY:-$OPENHANDS_API_KEY}\" \\\n  -H \"Accept: application/json\" | \\\npython3 - <<'PY'\nimport json, sys\nfrom collections import Counter\nitems = (json.load(sys.stdin) or {}).get(\"items\", [])\naction_ids = {e.get(\"id\") for e in items if e.get(\"kind\") == \"ActionEvent\"}\nobs_action_ids = [e.get(\"action_id\") for e in items if e.get(\"kind\") == \"ObservationEvent\" and e.get(\"action_id\")]\nobserved = set(obs_action_ids)\nprint(\"actions:\", len(action_ids))\nprint(\"observations:\", len(observed))\nunmatched = action_ids - observed\nprint(\"unmatched actions:\", list(unmatched)[:20] if unmatched else \"none\")\ndups = [aid for aid, c in Counter(obs_action_ids).items() if c > 1]\nprint(\"duplicate observation action_ids:\", list(dups)[:20] if dups else \"none\")\nPY\n```\n\n\n## Quick start (Python)\n\n```python\n# Copy `skills/openhands-api/scripts/openhands_api.py` into your project (e.g. as `openhands_api.py`),\n# then import it normally:\nfrom openhands_api import OpenHandsAPI\n\n# prefers OPENHANDS_CLOUD_API_KEY; the `with` block closes the pooled connections\nwith OpenHandsAPI() as api:\n    me = api.users_me()\n    print(me)\n\n    recent = api.app_conversations_search(limit=5)\n    print(recent)\n```\n\nReuse one client for a whole script rather than creating one per call: it keeps a keep-alive connection pool, so polling and paging skip repeated TCP/TLS handshakes. If `h2` is installed (`pip install 'httpx[http2]'`), the client negotiates HTTP/2 automatically. Likewise, installing `httpx[brotli]` (or `httpx[zstd]`) makes httpx advertise and decode those encodings in addition to gzip, which shrinks large event-search responses; don't set `Accept-Encoding` by hand, or responses may arrive in an encoding httpx cannot decode.\n\n## CLI examples\n\nSearch conversations:\n\n```bash\nexport OPENHANDS_CLOUD_API_KEY=\"...\"\npython skills/openhands-api/scripts/openhands_api.py search-conversations --limit 5\n```\n\nStart a conversation from a prompt file:\n\n```bash\npython skills/openhands-api/scripts/openhands_api.py start-conversation \\\n  --prompt-file skills/openhands-api/references/example_prompt.md \\\n  --repo owner/repo \\\n  --branch main\n```\n\nStart one conversation per `*.md` prompt file in a directory, a few at a time over one shared connection pool (each one may create a sandbox, so keep the directory small):\n\n```bash\npython skills/openhands-api/scripts/openhands_api.py start-conversations-batch \\\n  --prompt-dir prompts/ \\\n  --repo owner/repo \\\n  --concurrency 4\n```\n\nWait for several start-tasks at once (each poll is one batched request for the tasks still pending):\n\n```bash\npython skills/openhands-api/scripts/openhands_api.py poll-start-tasks --ids TASK_ID_1 TASK_ID_2\n```\n\n## Notes for AI agents extending this client\n\n- Prefer `.../search` endpoints with a small `limit`.\n- Avoid loops that could generate many API calls.\n- Start conversations only when asked: it may create sandboxes and cost money.\n- For sandbox file operations and command execution, use the agent server endpoints with `X-Session-API-Key`.\n\nSee also:\n- `skills/openhands-api/scripts/openhands_api.py`\n- The original inspiration client: `enyst/llm-playground` → `openhands-api-client-v1/scripts/cloud_api_v1.py`\n- Troubleshooting content and real-world usage feedback → `https://github.com/jpshackelford/.openhands/tree/main/skills/openhands-cloud-api`\n\n## Source of truth\n\nThis skill is aligned against the current OpenHands API docs and implementation:\n\n- `OpenHands/docs/openhands/usage/cloud/cloud-api.mdx`\n- `OpenHands/docs/openhands/usage/agent-canvas/backend-setup/local.mdx`\n- `OpenHands/docs/sdk/arch/agent-server.mdx`\n- `OpenHands/docs/openhands/usage/api/v1.mdx`\n- `OpenHands/OpenHands/openhands/app_server/v1_router.py`\n- `OpenHands/OpenHands/openhands/app_server/app_conversation/app_conversation_router.py`\n- `OpenHands/OpenHands/openhands/app_server/app_conversation/app_conversation_models.py`"
   },
   {
     "name": "openhands-automation",
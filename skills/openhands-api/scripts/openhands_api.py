@@ -2,7 +2,7 @@
 
 This file is intentionally:
 - small (easy to copy into other repos)
-- dependency-light (only `httpx`)
+- dependency-light (only `httpx`; `orjson` is used for large responses when installed)
 - opinionated in a helpful way (defaults to OpenHands Cloud)
 
 Audience: AI agents.
@@ -26,17 +26,31 @@ adapt it without strict schema maintenance.
 
 from __future__ import annotations
 
-import argparse
+import functools
+import importlib.util
+import itertools
 import json
 import os
+import random
+import re
+import sys
+import threading
 import time
-import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
 
 import httpx
 
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib decoder is used instead.
+    orjson = None
+
 
 DEFAULT_BASE_URL = "https://app.all-hands.dev"
 PREFERRED_API_KEY_ENV_VARS = ("OPENHANDS_CLOUD_API_KEY", "OPENHANDS_API_KEY")
@@ -48,9 +62,61 @@ START_TASK_TERMINAL_STATUSES = frozenset(
 )
 
 
+# Batch lookups send at most this many ids per request (keeps URLs well under server limits)
+# and run at most BATCH_LOOKUP_MAX_WORKERS chunk requests at a time.
+BATCH_LOOKUP_CHUNK_SIZE = 50
+BATCH_LOOKUP_MAX_WORKERS = 8
+
+
+# How long effectively-static responses (users/me, sandbox specs) are reused.
+DEFAULT_RESPONSE_CACHE_TTL_S = 300.0
+
+
 # Safety cap for paging calls. Keeps responses small and consistent across clients.
 AGENT_EVENTS_SEARCH_MAX_LIMIT = 100
 
+# Top-level event files inside a trajectory zip (same set the old `event_*.json` glob matched).
+_TRAJECTORY_EVENT_NAME = re.compile(r"event_[^/]*\.json")
+
+# Connection pools. Keep-alive connections are reused across polls and pages; idle ones are
+# dropped after a minute.
+APP_SERVER_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60)
+AGENT_SERVER_LIMITS = httpx.Limits(max_keepalive_connections=5, max_connections=10, keepalive_expiry=60)
+
+# HTTP/2 lets concurrent requests share one connection, but needs the optional `h2` package
+# (`pip install 'httpx[http2]'`). Without it the client stays on HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+# Downloads are written in chunks of this size so large trajectories never sit in memory whole.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _decode_json(r: httpx.Response) -> Any:
+    """Decode a (potentially large) JSON body, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+def _loads_json(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _format_json(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def _write_stream(r: httpx.Response, out: Path) -> int:
+    size = 0
+    with out.open("wb") as f:
+        for chunk in r.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            size += len(chunk)
+    return size
+
 
 @dataclass(frozen=True)
 class OpenHandsAPIConfig:
@@ -65,7 +131,20 @@ class OpenHandsAPIConfig:
 class OpenHandsAPI:
     """Minimal OpenHands Cloud API client for the supported V1 API."""
 
-    def __init__(self, api_key: str | None = None, base_url: str = DEFAULT_BASE_URL):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        cache_ttl_s: float = DEFAULT_RESPONSE_CACHE_TTL_S,
+        client: httpx.Client | None = None,
+    ):
+        """Create a client.
+
+        Pass `client` to supply your own `httpx.Client` for app-server calls (custom
+        proxies, transports, or a test double). It is used as-is, so it must already
+        send the `Authorization: Bearer ...` header, and `close()` leaves it open.
+        """
         resolved_key = api_key
         if not resolved_key:
             for env_name in PREFERRED_API_KEY_ENV_VARS:
@@ -77,13 +156,30 @@ class OpenHandsAPI:
             raise ValueError(f"Missing API key. Set one of: {env_list}, or pass api_key=...")
 
         self._cfg = OpenHandsAPIConfig(api_key=resolved_key, base_url=base_url.rstrip("/"))
-        self._client = httpx.Client(
+        # URL prefixes are fixed for the client's lifetime; build them once instead of per call.
+        self._api_v1_url = self._cfg.api_v1_url
+        self._app_conversations_url = f"{self._api_v1_url}/app-conversations"
+        self._conversation_url = f"{self._api_v1_url}/conversation"
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.Client(
             headers={
                 "Authorization": f"Bearer {self._cfg.api_key}",
                 "Content-Type": "application/json",
             },
-            timeout=30,
+            timeout=httpx.Timeout(30.0),
+            # One long-lived pool so repeated calls (polling, paging) reuse warm connections.
+            http2=HTTP2_AVAILABLE,
+            limits=APP_SERVER_LIMITS,
         )
+        # Agent servers use different hosts and auth, so each gets its own pooled client.
+        self._agent_clients: dict[str, httpx.Client] = {}
+        self._agent_clients_lock = threading.Lock()
+        # (kind, key) -> (expires_at, raw body); see `invalidate()`. A TTL of 0 disables it.
+        # Bodies are kept as bytes and decoded per hit, so callers never share a mutable result.
+        self._cache_ttl_s = max(0.0, float(cache_ttl_s))
+        self._cache: dict[tuple[str, Any], tuple[float, bytes]] = {}
+        # conversation id -> (ETag, raw body) for conditional re-fetches in app_conversation_get().
+        self._etags: dict[str, tuple[str, bytes]] = {}
 
     @property
     def base_url(self) -> str:
@@ -91,71 +187,166 @@ class OpenHandsAPI:
 
     @property
     def api_v1_url(self) -> str:
-        return self._cfg.api_v1_url
+        return self._api_v1_url
 
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
+        with self._agent_clients_lock:
+            agent_clients, self._agent_clients = self._agent_clients, {}
+        for client in agent_clients.values():
+            client.close()
+
+    def invalidate(self, conversation_id: str | None = None) -> None:
+        """Drop one conversation's ETag validator, or every cached response when no id is given."""
+        if conversation_id is None:
+            self._cache.clear()
+            self._etags.clear()
+        else:
+            self._etags.pop(conversation_id, None)
+
+    def _cached(self, kind: str, key: Any) -> Any | None:
+        entry = self._cache.get((kind, key))
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._cache.pop((kind, key), None)
+            return None
+        return _loads_json(entry[1])
+
+    def _remember(self, kind: str, key: Any, r: httpx.Response) -> Any:
+        if self._cache_ttl_s:
+            self._cache[(kind, key)] = (time.monotonic() + self._cache_ttl_s, r.content)
+        return _decode_json(r)
+
+    def __enter__(self) -> OpenHandsAPI:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     # -----------------------------
     # App server endpoints (Bearer auth)
     # -----------------------------
 
     def users_me(self) -> dict[str, Any]:
-        r = self._client.get(f"{self.api_v1_url}/users/me")
+        cached = self._cached("users_me", None)
+        if cached is not None:
+            return cached
+        r = self._client.get(f"{self._api_v1_url}/users/me")
         r.raise_for_status()
-        return r.json()
+        return self._remember("users_me", None, r)
 
     def app_conversations_search(self, *, limit: int = 20) -> dict[str, Any]:
         limit = max(1, int(limit))
         r = self._client.get(
-            f"{self.api_v1_url}/app-conversations/search", params={"limit": limit}
+            f"{self._app_conversations_url}/search", params={"limit": limit}
         )
         r.raise_for_status()
-        return r.json()
+        return _decode_json(r)
 
     def app_conversations_count(self) -> dict[str, Any]:
-        r = self._client.get(f"{self.api_v1_url}/app-conversations/count")
+        r = self._client.get(f"{self._app_conversations_url}/count")
         r.raise_for_status()
         return r.json()
 
+    def _get_by_ids(self, url: str, ids: list[str]) -> list[Any]:
+        """GET `url?ids=...`, splitting long id lists into concurrent chunked requests.
+
+        Results keep the order of `ids`.
+        """
+
+        def _get_chunk(chunk: list[str]) -> list[Any]:
+            r = self._client.get(url, params={"ids": chunk})
+            r.raise_for_status()
+            return r.json()
+
+        if len(ids) <= BATCH_LOOKUP_CHUNK_SIZE:
+            return _get_chunk(ids)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunks = [ids[i : i + BATCH_LOOKUP_CHUNK_SIZE] for i in range(0, len(ids), BATCH_LOOKUP_CHUNK_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(BATCH_LOOKUP_MAX_WORKERS, len(chunks))) as ex:
+            return list(itertools.chain.from_iterable(ex.map(_get_chunk, chunks)))
+
     def app_conversations_get_batch(self, *, ids: list[str]) -> list[dict[str, Any]]:
         if not ids:
             return []
-        r = self._client.get(f"{self.api_v1_url}/app-conversations", params={"ids": ids})
-        r.raise_for_status()
-        return r.json()
+        return self._get_by_ids(self._app_conversations_url, ids)
 
     def app_conversation_get(self, conversation_id: str) -> dict[str, Any] | None:
-        items = self.app_conversations_get_batch(ids=[conversation_id])
+        """Fetch one app conversation.
+
+        Conversations are always re-fetched, since their sandbox state can change at any
+        time (e.g. via `sandboxes_pause()`). When the server sends an `ETag`, the next call for the same id is a conditional
+        GET (`If-None-Match`); a `304 Not Modified` reuses the previous body, which keeps
+        status polling cheap while nothing changes.
+        """
+        validator = self._etags.get(conversation_id)
+        extra = {"headers": {"If-None-Match": validator[0]}} if validator else {}
+        r = self._client.get(self._app_conversations_url, params={"ids": [conversation_id]}, **extra)
+        if validator and r.status_code == 304:
+            items = _loads_json(validator[1])
+        else:
+            r.raise_for_status()
+            items = _decode_json(r)
+            etag = r.headers.get("etag")
+            if etag and items:
+                self._etags[conversation_id] = (etag, r.content)
         return items[0] if items else None
 
     def sandboxes_search(self, *, limit: int = 20) -> dict[str, Any]:
         limit = max(1, int(limit))
-        r = self._client.get(f"{self.api_v1_url}/sandboxes/search", params={"limit": limit})
+        r = self._client.get(f"{self._api_v1_url}/sandboxes/search", params={"limit": limit})
         r.raise_for_status()
         return r.json()
 
     def sandbox_specs_search(self, *, limit: int = 20) -> dict[str, Any]:
         limit = max(1, int(limit))
+        cached = self._cached("sandbox_specs", limit)
+        if cached is not None:
+            return cached
         r = self._client.get(
-            f"{self.api_v1_url}/sandbox-specs/search", params={"limit": limit}
+            f"{self._api_v1_url}/sandbox-specs/search", params={"limit": limit}
         )
         r.raise_for_status()
-        return r.json()
+        return self._remember("sandbox_specs", limit, r)
 
     def conversation_events_search(
-        self, conversation_id: str, *, limit: int = 50
+        self, conversation_id: str, *, limit: int = 50, page_id: str | None = None
     ) -> dict[str, Any]:
         limit = max(1, int(limit))
+        params: dict[str, Any] = {"limit": limit}
+        if page_id:
+            params["page_id"] = page_id
         r = self._client.get(
-            f"{self.api_v1_url}/conversation/{conversation_id}/events/search",
-            params={"limit": limit},
+            f"{self._conversation_url}/{conversation_id}/events/search",
+            params=params,
         )
         r.raise_for_status()
-        return r.json()
+        return _decode_json(r)
+
+    def iter_conversation_events(
+        self, conversation_id: str, *, page_size: int = 100
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every event of a conversation, following `next_page_id` across pages.
+
+        All pages go over this client's pooled keep-alive connection, so reading a long
+        conversation costs one request per `page_size` events and no extra handshakes.
+        Prefer this over calling `conversation_events_search()` in a loop yourself.
+        """
+
+        page_id: str | None = None
+        while True:
+            page = self.conversation_events_search(conversation_id, limit=page_size, page_id=page_id)
+            yield from page.get("items") or []
+            page_id = page.get("next_page_id")
+            if not page_id:
+                return
 
     def conversation_events_count(self, conversation_id: str) -> dict[str, Any]:
-        r = self._client.get(f"{self.api_v1_url}/conversation/{conversation_id}/events/count")
+        r = self._client.get(f"{self._conversation_url}/{conversation_id}/events/count")
         r.raise_for_status()
         return r.json()
 
@@ -200,30 +391,26 @@ class OpenHandsAPI:
         if title:
             payload["title"] = title
 
-        r = self._client.post(f"{self.api_v1_url}/app-conversations", json=payload, timeout=120)
+        r = self._client.post(self._app_conversations_url, json=payload, timeout=120)
         r.raise_for_status()
         return r.json()
 
     def app_conversations_start_tasks_get_batch(self, *, ids: list[str]) -> list[dict[str, Any]]:
         if not ids:
             return []
-        r = self._client.get(
-            f"{self.api_v1_url}/app-conversations/start-tasks", params={"ids": ids}
-        )
-        r.raise_for_status()
-        return r.json()
+        return self._get_by_ids(f"{self._app_conversations_url}/start-tasks", ids)
 
     def app_conversation_start_task_get(self, task_id: str) -> dict[str, Any] | None:
         items = self.app_conversations_start_tasks_get_batch(ids=[task_id])
         return items[0] if items else None
 
     def sandboxes_pause(self, sandbox_id: str) -> dict[str, Any]:
-        r = self._client.post(f"{self.api_v1_url}/sandboxes/{sandbox_id}/pause", timeout=60)
+        r = self._client.post(f"{self._api_v1_url}/sandboxes/{sandbox_id}/pause", timeout=60)
         r.raise_for_status()
         return r.json()
 
     def sandboxes_resume(self, sandbox_id: str) -> dict[str, Any]:
-        r = self._client.post(f"{self.api_v1_url}/sandboxes/{sandbox_id}/resume", timeout=60)
+        r = self._client.post(f"{self._api_v1_url}/sandboxes/{sandbox_id}/resume", timeout=60)
         r.raise_for_status()
         return r.json()
 
@@ -234,14 +421,14 @@ class OpenHandsAPI:
 
         Note: this endpoint expects the **app_conversation_id** (not the start-task id).
         """
-        url = f"{self.api_v1_url}/app-conversations/{app_conversation_id}/download"
-        r = self._client.get(url, timeout=60)
-        r.raise_for_status()
+        url = f"{self._app_conversations_url}/{app_conversation_id}/download"
         out = Path(output_file)
-        out.write_bytes(r.content)
+        with self._client.stream("GET", url, timeout=60) as r:
+            r.raise_for_status()
+            size = _write_stream(r, out)
         return {
             "file": str(out),
-            "size": len(r.content),
+            "size": size,
             "content_type": r.headers.get("content-type"),
         }
 
@@ -250,15 +437,20 @@ class OpenHandsAPI:
         app_conversation_id: str,
         *,
         zip_file: str | Path,
-        extract_dir: str | Path,
+        extract_dir: str | Path | None = None,
+        count_only: bool = False,
     ) -> dict[str, Any]:
-        """Fallback event counting: download trajectory zip, extract, count event files.
+        """Fallback event counting: download trajectory zip, count event files.
 
         This is heavier than calling a count endpoint, but it is still a single API call and
         also gives you the full exported event payloads.
 
-        Cleanup (optional): this helper writes a zip file and extracts JSON events. If you
-        want to clean up afterwards, you can remove them, e.g.:
+        Events are counted from the zip's directory, so nothing has to be extracted just to
+        count. With `count_only=True` the zip is not extracted at all and `extract_dir` may be
+        omitted; otherwise it is extracted into `extract_dir`.
+
+        Cleanup (optional): this helper writes a zip file and (unless `count_only`) extracts
+        JSON events. If you want to clean up afterwards, you can remove them, e.g.:
 
         - `zip_path.unlink(missing_ok=True)`
         - `shutil.rmtree(extract_path, ignore_errors=True)`
@@ -266,23 +458,28 @@ class OpenHandsAPI:
         Returns a small summary dict including `event_count`.
         """
 
-        zip_path = Path(zip_file)
-        extract_path = Path(extract_dir)
+        if extract_dir is None and not count_only:
+            raise ValueError("extract_dir is required unless count_only=True")
 
+        zip_path = Path(zip_file)
         download_meta = self.app_conversation_download_zip(app_conversation_id, output_file=zip_path)
-        extract_path.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_path)
+        import zipfile
 
-        event_count = len(list(extract_path.glob("event_*.json")))
-        has_meta = (extract_path / "meta.json").exists()
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            names = zf.namelist()
+            event_count = sum(1 for name in names if _TRAJECTORY_EVENT_NAME.fullmatch(name))
+            has_meta = "meta.json" in names
+            if not count_only:
+                extract_path = Path(extract_dir)
+                extract_path.mkdir(parents=True, exist_ok=True)
+                zf.extractall(extract_path)
 
         return {
             "event_count": event_count,
             "has_meta": has_meta,
             "zip": download_meta,
-            "extract_dir": str(extract_path),
+            "extract_dir": None if count_only else str(extract_path),
         }
 
     # -----------------------------
@@ -293,6 +490,29 @@ class OpenHandsAPI:
     def agent_headers(session_api_key: str) -> dict[str, str]:
         return {"X-Session-API-Key": session_api_key, "Content-Type": "application/json"}
 
+    def _agent_client(self, agent_server_url: str) -> httpx.Client:
+        """Return the keep-alive client for one agent server, creating it on first use."""
+        key = agent_server_url.rstrip("/")
+        client = self._agent_clients.get(key)
+        if client is None:
+            with self._agent_clients_lock:
+                client = self._agent_clients.get(key)
+                if client is None:
+                    client = httpx.Client(
+                        base_url=key,
+                        timeout=httpx.Timeout(30.0),
+                        http2=HTTP2_AVAILABLE,
+                        limits=AGENT_SERVER_LIMITS,
+                    )
+                    self._agent_clients[key] = client
+        return client
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _shared_agent_headers(session_api_key: str) -> Mapping[str, str]:
+        # Read-only so the cached mapping can be handed to every agent-server call safely.
+        return MappingProxyType(OpenHandsAPI.agent_headers(session_api_key))
+
 
     @staticmethod
     def _agent_event_filter_params(
@@ -329,6 +549,7 @@ class OpenHandsAPI:
         kind: str | None = None,
         source: str | None = None,
         body: str | None = None,
+        page_id: str | None = None,
     ) -> dict[str, Any]:
         """Search events via the sandbox agent-server.
 
@@ -337,13 +558,17 @@ class OpenHandsAPI:
         - `sort_order` must be one of: "TIMESTAMP", "TIMESTAMP_DESC".
         - timestamp filters are passed as ISO-8601 strings (e.g. "2026-02-14T21:54:00Z").
           The server accepts both timezone-aware and naive datetimes.
+        - pass a response's `next_page_id` as `page_id` to fetch the following page
+          (or use `iter_agent_events()`).
         """
 
-        url = f"{agent_server_url.rstrip('/')}/api/conversations/{conversation_id}/events/search"
+        path = f"/api/conversations/{conversation_id}/events/search"
         capped_limit = min(AGENT_EVENTS_SEARCH_MAX_LIMIT, max(1, int(limit)))
         params: dict[str, Any] = {"limit": capped_limit}
         if sort_order is not None:
             params["sort_order"] = sort_order
+        if page_id:
+            params["page_id"] = page_id
         params.update(
             self._agent_event_filter_params(
                 timestamp_gte=timestamp_gte,
@@ -354,14 +579,55 @@ class OpenHandsAPI:
             )
         )
 
-        r = httpx.get(
-            url,
-            headers=self.agent_headers(session_api_key),
+        r = self._agent_client(agent_server_url).get(
+            path,
+            headers=self._shared_agent_headers(session_api_key),
             params=params,
             timeout=30,
         )
         r.raise_for_status()
-        return r.json()
+        return _decode_json(r)
+
+    def iter_agent_events(
+        self,
+        *,
+        agent_server_url: str,
+        session_api_key: str,
+        conversation_id: str,
+        page_size: int = AGENT_EVENTS_SEARCH_MAX_LIMIT,
+        sort_order: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+        kind: str | None = None,
+        source: str | None = None,
+        body: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every matching agent-server event, following the `next_page_id` cursor.
+
+        Event ids are UUIDs, so paging by "last id seen" does not work; the server's
+        cursor is the only reliable way to walk the full log. Pages are fetched lazily
+        over the agent server's keep-alive client, `page_size` events at a time.
+        """
+
+        page_id: str | None = None
+        while True:
+            page = self.agent_events_search(
+                agent_server_url=agent_server_url,
+                session_api_key=session_api_key,
+                conversation_id=conversation_id,
+                limit=page_size,
+                sort_order=sort_order,
+                timestamp_gte=timestamp_gte,
+                timestamp_lt=timestamp_lt,
+                kind=kind,
+                source=source,
+                body=body,
+                page_id=page_id,
+            )
+            yield from page.get("items") or []
+            page_id = page.get("next_page_id")
+            if not page_id:
+                return
 
     def agent_events_count(
         self,
@@ -380,7 +646,7 @@ class OpenHandsAPI:
         Timestamp filters are passed as ISO-8601 strings (e.g. "2026-02-14T21:54:00Z").
         """
 
-        url = f"{agent_server_url.rstrip('/')}/api/conversations/{conversation_id}/events/count"
+        path = f"/api/conversations/{conversation_id}/events/count"
         params = self._agent_event_filter_params(
             timestamp_gte=timestamp_gte,
             timestamp_lt=timestamp_lt,
@@ -389,9 +655,9 @@ class OpenHandsAPI:
             body=body,
         )
 
-        r = httpx.get(
-            url,
-            headers=self.agent_headers(session_api_key),
+        r = self._agent_client(agent_server_url).get(
+            path,
+            headers=self._shared_agent_headers(session_api_key),
             params=params,
             timeout=30,
         )
@@ -407,11 +673,13 @@ class OpenHandsAPI:
         cwd: str | None = None,
         timeout_s: int = 30,
     ) -> dict[str, Any]:
-        url = f"{agent_server_url.rstrip('/')}/api/bash/execute_bash_command"
+        path = "/api/bash/execute_bash_command"
         payload: dict[str, Any] = {"command": command, "timeout": int(timeout_s)}
         if cwd:
             payload["cwd"] = cwd
-        r = httpx.post(url, headers=self.agent_headers(session_api_key), json=payload, timeout=60)
+        r = self._agent_client(agent_server_url).post(
+            path, headers=self._shared_agent_headers(session_api_key), json=payload, timeout=60
+        )
         r.raise_for_status()
         return r.json()
 
@@ -424,12 +692,13 @@ class OpenHandsAPI:
         output_file: str | Path,
     ) -> dict[str, Any]:
         p = path if path.startswith("/") else f"/{path}"
-        url = f"{agent_server_url.rstrip('/')}/api/file/download{p}"
-        r = httpx.get(url, headers=self.agent_headers(session_api_key), timeout=30)
-        r.raise_for_status()
+        path = f"/api/file/download{p}"
         out = Path(output_file)
-        out.write_bytes(r.content)
-        return {"file": str(out), "size": len(r.content)}
+        client = self._agent_client(agent_server_url)
+        with client.stream("GET", path, headers=self._shared_agent_headers(session_api_key), timeout=30) as r:
+            r.raise_for_status()
+            size = _write_stream(r, out)
+        return {"file": str(out), "size": size}
 
     def agent_upload_text_file(
         self,
@@ -441,11 +710,11 @@ class OpenHandsAPI:
         content_type: str = "text/plain",
     ) -> dict[str, Any]:
         p = path if path.startswith("/") else f"/{path}"
-        url = f"{agent_server_url.rstrip('/')}/api/file/upload{p}"
+        path = f"/api/file/upload{p}"
         filename = os.path.basename(p)
         headers = {"X-Session-API-Key": session_api_key}
         files = {"file": (filename, content.encode("utf-8"), content_type)}
-        r = httpx.post(url, headers=headers, files=files, timeout=30)
+        r = self._agent_client(agent_server_url).post(path, headers=headers, files=files, timeout=30)
         r.raise_for_status()
         return r.json() if r.text else {"success": True}
 
@@ -464,11 +733,14 @@ class OpenHandsAPI:
         run: bool = True,
     ) -> dict[str, Any]:
         main_text = Path(prompt_file).read_text(encoding="utf-8")
-        if append_file and Path(append_file).exists():
-            tail = Path(append_file).read_text(encoding="utf-8")
-            initial = f"{main_text}\n\n{tail}"
-        else:
-            initial = main_text
+        tail = None
+        if append_file:
+            # A missing append file is optional, as before; open directly rather than stat first.
+            try:
+                tail = Path(append_file).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
+        initial = main_text if tail is None else f"{main_text}\n\n{tail}"
 
         return self.app_conversation_start(
             initial_message=initial,
@@ -499,7 +771,9 @@ class OpenHandsAPI:
 
         It is intentionally *polite*:
         - sleeps between requests
-        - uses exponential backoff (capped by `max_interval_s`)
+        - uses exponential backoff with a little jitter (capped by `max_interval_s`)
+        - drops back to `poll_interval_s` whenever the status changes, so the next
+          transition is noticed quickly
         - supports `max_polls` to cap the total number of API calls
 
         Terminal statuses are defined in START_TASK_TERMINAL_STATUSES.
@@ -508,53 +782,109 @@ class OpenHandsAPI:
             TimeoutError: if the task doesn't reach a terminal state in time.
         """
 
+        return self.poll_start_tasks_until_ready(
+            [task_id],
+            timeout_s=timeout_s,
+            poll_interval_s=poll_interval_s,
+            backoff_factor=backoff_factor,
+            max_interval_s=max_interval_s,
+            max_polls=max_polls,
+        )[task_id]
+
+    def poll_start_tasks_until_ready(
+        self,
+        task_ids: list[str],
+        *,
+        timeout_s: int = 10 * 60,
+        poll_interval_s: float = 2.0,
+        backoff_factor: float = 1.5,
+        max_interval_s: float = 10.0,
+        max_polls: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Poll several start-tasks until every one reaches a terminal state.
+
+        Each round is a single batched `GET /api/v1/app-conversations/start-tasks?ids=...`
+        covering only the tasks that are still pending, so tracking N delegated
+        conversations costs one request per round rather than N.
+
+        Returns a dict mapping each task id to its terminal start-task. Backoff,
+        `timeout_s` and `max_polls` behave as in `poll_start_task_until_ready()`.
+
+        Raises:
+            TimeoutError: if any task doesn't reach a terminal state in time.
+        """
+
         deadline = time.monotonic() + float(timeout_s)
-        interval = max(0.25, float(poll_interval_s))
+        base_interval = interval = max(0.25, float(poll_interval_s))
         factor = max(1.0, float(backoff_factor))
         max_interval = max(interval, float(max_interval_s))
 
+        ordered_ids = list(dict.fromkeys(task_ids))
+        pending = ordered_ids
+        done: dict[str, dict[str, Any]] = {}
+        last: dict[str, dict[str, Any] | None] = {}
+        # Normalized status per task from the previous round; saves re-deriving it from `last`.
+        last_status: dict[str, str] = {}
+        poll_cap = None if max_polls is None else int(max_polls)
         polls = 0
-        last: dict[str, Any] | None = None
 
-        while True:
-            if max_polls is not None and polls >= int(max_polls):
-                raise TimeoutError(
-                    f"Start task {task_id} did not reach terminal state (max_polls={max_polls}, last={last})"
-                )
+        def _unfinished() -> tuple[str, Any]:
+            label = "Start task" if len(pending) == 1 else "Start tasks"
+            states = last.get(pending[0]) if len(pending) == 1 else {i: last.get(i) for i in pending}
+            return f"{label} {', '.join(pending)} did not reach terminal state", states
+
+        while pending:
+            if poll_cap is not None and polls >= poll_cap:
+                what, states = _unfinished()
+                raise TimeoutError(f"{what} (max_polls={max_polls}, last={states})")
 
             remaining = deadline - time.monotonic()
             if remaining <= 0:
-                raise TimeoutError(
-                    f"Start task {task_id} did not reach terminal state in {timeout_s}s (last={last})"
-                )
+                what, states = _unfinished()
+                raise TimeoutError(f"{what} in {timeout_s}s (last={states})")
 
-            last = self.app_conversation_start_task_get(task_id)
+            items = self.app_conversations_start_tasks_get_batch(ids=pending)
             polls += 1
 
-            status = self._start_task_status(last)
-            if status in START_TASK_TERMINAL_STATUSES:
-                return last or {}
-
-            sleep_s = min(interval, remaining)
+            # The batch endpoint answers positionally; a missing or null entry means "not yet".
+            still_pending = []
+            changed = False
+            for i, task_id in enumerate(pending):
+                task = items[i] if i < len(items) else None
+                status = self._start_task_status(task)
+                previous = last_status.get(task_id)
+                changed = changed or (previous is not None and previous != status)
+                last[task_id] = task
+                last_status[task_id] = status
+                if status in START_TASK_TERMINAL_STATUSES:
+                    done[task_id] = task or {}
+                else:
+                    still_pending.append(task_id)
+            pending = still_pending
+            if not pending:
+                break
+
+            if changed:
+                interval = base_interval
+            # Jitter keeps many pollers started together from hitting the API in lockstep.
+            sleep_s = min(interval + random.uniform(0, 0.25 * interval), remaining)
             if sleep_s > 0:
                 time.sleep(sleep_s)
             interval = min(max_interval, interval * factor)
 
+        return {task_id: done[task_id] for task_id in ordered_ids}
+
 
 OpenHandsV1API = OpenHandsAPI
 
 def _cmd_search_conversations(args: argparse.Namespace) -> int:
-    api = OpenHandsAPI(api_key=args.api_key, base_url=args.base_url)
-    try:
-        print(json.dumps(api.app_conversations_search(limit=args.limit), indent=2))
+    with OpenHandsAPI(api_key=args.api_key, base_url=args.base_url) as api:
+        print(_format_json(api.app_conversations_search(limit=args.limit)))
         return 0
-    finally:
-        api.close()
 
 
 def _cmd_start_conversation(args: argparse.Namespace) -> int:
-    api = OpenHandsAPI(api_key=args.api_key, base_url=args.base_url)
-    try:
+    with OpenHandsAPI(api_key=args.api_key, base_url=args.base_url) as api:
         resp = api.app_conversation_start_from_prompt_files(
             args.prompt_file,
             selected_repository=args.repo,
@@ -563,13 +893,53 @@ def _cmd_start_conversation(args: argparse.Namespace) -> int:
             append_file=args.append_file,
             run=not args.no_run,
         )
-        print(json.dumps(resp, indent=2))
+        print(_format_json(resp))
+        return 0
+
+
+def _cmd_start_conversations_batch(args: argparse.Namespace) -> int:
+    prompt_files = sorted(Path(args.prompt_dir).glob("*.md"))
+    if not prompt_files:
+        print(f"No *.md prompt files found in {args.prompt_dir}", file=sys.stderr)
+        return 2
+
+    with OpenHandsAPI(api_key=args.api_key, base_url=args.base_url) as api:
+
+        def _start(prompt_file: Path) -> dict[str, Any]:
+            try:
+                resp = api.app_conversation_start_from_prompt_files(
+                    prompt_file,
+                    selected_repository=args.repo,
+                    selected_branch=args.branch,
+                    append_file=args.append_file,
+                    run=not args.no_run,
+                )
+            except Exception as e:  # Report it per file: the other starts have already gone out.
+                return {"prompt_file": str(prompt_file), "error": f"{type(e).__name__}: {e}"}
+            return {"prompt_file": str(prompt_file), "start_task": resp}
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # One client (and connection pool) is shared by all worker threads.
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as ex:
+            results = list(ex.map(_start, prompt_files))
+
+    print(_format_json(results))
+    return 1 if any("error" in r for r in results) else 0
+
+
+def _cmd_poll_start_tasks(args: argparse.Namespace) -> int:
+    with OpenHandsAPI(api_key=args.api_key, base_url=args.base_url) as api:
+        tasks = api.poll_start_tasks_until_ready(
+            args.ids, timeout_s=args.timeout_s, max_interval_s=args.max_interval_s
+        )
+        print(_format_json(tasks))
         return 0
-    finally:
-        api.close()
 
 
 def main(argv: list[str] | None = None) -> int:
+    import argparse  # Only the CLI needs it; keep `import openhands_api` cheap for library use.
+
     parser = argparse.ArgumentParser(prog="openhands_api.py")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
@@ -598,6 +968,44 @@ def main(argv: list[str] | None = None) -> int:
     p_start.add_argument("--no-run", action="store_true", help="If set, do not auto-run after sending initial message")
     p_start.set_defaults(func=_cmd_start_conversation)
 
+    p_batch = sub.add_parser(
+        "start-conversations-batch",
+        help="POST /api/v1/app-conversations once per *.md prompt file in a directory",
+    )
+    p_batch.add_argument(
+        "--api-key",
+        default=None,
+        help="Defaults to OPENHANDS_CLOUD_API_KEY, then OPENHANDS_API_KEY",
+    )
+    p_batch.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    p_batch.add_argument("--prompt-dir", required=True, help="Directory of *.md prompt files (sorted by name)")
+    p_batch.add_argument("--append-file", default=None)
+    p_batch.add_argument("--repo", default=None)
+    p_batch.add_argument("--branch", default=None)
+    p_batch.add_argument("--concurrency", type=int, default=4, help="Conversations started in parallel (default: 4)")
+    p_batch.add_argument("--no-run", action="store_true", help="If set, do not auto-run after sending initial message")
+    p_batch.set_defaults(func=_cmd_start_conversations_batch)
+
+    p_poll = sub.add_parser(
+        "poll-start-tasks",
+        help="Poll GET /api/v1/app-conversations/start-tasks until every task is terminal",
+    )
+    p_poll.add_argument(
+        "--api-key",
+        default=None,
+        help="Defaults to OPENHANDS_CLOUD_API_KEY, then OPENHANDS_API_KEY",
+    )
+    p_poll.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    p_poll.add_argument("--ids", nargs="+", required=True, help="Start-task ids (one batched request per poll)")
+    p_poll.add_argument("--timeout-s", type=int, default=10 * 60)
+    p_poll.add_argument(
+        "--max-interval-s",
+        type=float,
+        default=10.0,
+        help="Upper bound for the backoff between polls (default: 10)",
+    )
+    p_poll.set_defaults(func=_cmd_poll_start_tasks)
+
     args = parser.parse_args(argv)
     return int(args.func(args))
 
@@ -0,0 +1,422 @@
+import asyncio
+import http.server
+import importlib
+import importlib.util
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "skills" / "discord" / "scripts"
+PACKAGE_NAME = "discord_skill_scripts"
+
+
+def _load_discord_module(name: str):
+    if PACKAGE_NAME not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE_NAME,
+            SCRIPTS_DIR / "__init__.py",
+            submodule_search_locations=[str(SCRIPTS_DIR)],
+        )
+        pkg = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE_NAME] = pkg
+        spec.loader.exec_module(pkg)
+    return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+
+class FakeResp:
+    def __init__(self, status_code=200, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def post(self, url, headers=None, data=None, timeout=None, stream=False):
+        self.calls.append({"url": url, "headers": headers, "data": data, "timeout": timeout})
+        return self.responses.pop(0)
+
+
+def test_post_json_sends_encoded_payload_and_decodes_response(monkeypatch):
+    mod = _load_discord_module("_http")
+    session = FakeSession([FakeResp(200, b'{"id": "123"}')])
+    monkeypatch.setattr(mod, "_SESSION", session)
+
+    result = mod.post_json(
+        url="https://discord.com/api/webhooks/1/token",
+        headers={"User-Agent": "test"},
+        payload={"content": "hi", "allowed_mentions": {"parse": []}},
+    )
+
+    assert result == {"id": "123"}
+    [call] = session.calls
+    assert call["headers"]["Content-Type"] == "application/json"
+    assert call["headers"]["User-Agent"] == "test"
+    assert isinstance(call["data"], bytes)
+    assert json.loads(call["data"]) == {"content": "hi", "allowed_mentions": {"parse": []}}
+
+
+def test_post_json_error_includes_truncated_body(monkeypatch):
+    mod = _load_discord_module("_http")
+
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([FakeResp(400, b'{"message": "bad"}' + b"x" * 1000)]))
+
+    with pytest.raises(mod.DiscordHTTPError) as excinfo:
+        mod.post_json(url="https://example.com/hook", headers={}, payload={"content": "hi"})
+
+    msg = str(excinfo.value)
+    assert "HTTP 400" in msg
+    assert 'Response: {"message": "bad"}' in msg
+    assert msg.endswith("x" * (500 - len('{"message": "bad"}')))
+
+
+def test_requests_backend_bounds_error_body_reads(monkeypatch):
+    mod = _load_discord_module("_http")
+    resp = FakeResp(502, b"x" * 100_000)
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([resp]))
+
+    result = mod._post_requests(url="https://example.com/hook", headers={}, data=b"{}", timeout_s=5)
+
+    assert result.status_code == 502
+    assert result.content == b"x" * mod._ERROR_BODY_READ_LIMIT
+    assert resp.closed
+
+
+def test_post_json_skips_json_parse_for_204_and_errors(monkeypatch):
+    mod = _load_discord_module("_http")
+    parsed = []
+    real_loads = mod.json_loads
+    monkeypatch.setattr(mod, "json_loads", lambda raw: parsed.append(raw) or real_loads(raw))
+
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([FakeResp(204, b"")]))
+    assert mod.post_json(url="https://example.com/hook", headers={}, payload={}) is None
+
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([FakeResp(500, b'{"message": "boom"}')]))
+    with pytest.raises(mod.DiscordHTTPError, match="boom"):
+        mod.post_json(url="https://example.com/hook", headers={}, payload={})
+
+    assert parsed == []
+
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([FakeResp(200, b"[1, 2]")]))
+    assert mod.post_json(url="https://example.com/hook", headers={}, payload={}) == {"raw": "[1, 2]"}
+    assert parsed == [b"[1, 2]"]
+
+
+def test_post_json_reuses_session_across_429_retries(monkeypatch):
+    mod = _load_discord_module("_http")
+    session = FakeSession(
+        [
+            FakeResp(429, b'{"retry_after": 0.5, "global": false}'),
+            FakeResp(204),
+        ]
+    )
+    sleeps = []
+    monkeypatch.setattr(mod, "_SESSION", session)
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    result = mod.post_json(url="https://example.com/hook", headers={}, payload={"content": "hi"}, jitter_s=0)
+
+    assert result is None
+    assert len(session.calls) == 2
+    assert session.calls[0]["data"] == session.calls[1]["data"]
+    assert sleeps == [0.5]
+
+
+def test_post_json_stops_retrying_when_budget_is_spent(monkeypatch):
+    mod = _load_discord_module("_http")
+    session = FakeSession([FakeResp(429, b'{"retry_after": 5}'), FakeResp(204)])
+    sleeps = []
+    monkeypatch.setattr(mod, "_SESSION", session)
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    with pytest.raises(mod.DiscordHTTPError, match="HTTP 429"):
+        mod.post_json(
+            url="https://example.com/hook",
+            headers={},
+            payload={"content": "hi"},
+            jitter_s=0,
+            retry_budget_s=1.0,
+        )
+
+    assert sleeps == []
+    assert len(session.calls) == 1
+
+
+def test_rate_limited_error_message_lists_known_rate_limit_fields(monkeypatch):
+    mod = _load_discord_module("_http")
+    headers = {"X-RateLimit-Bucket": "abc", "X-RateLimit-Reset-After": "2"}
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([FakeResp(429, b'{"retry_after": 2, "global": true}', headers)]))
+
+    with pytest.raises(mod.DiscordHTTPError) as excinfo:
+        mod.post_json(url="https://example.com/hook", headers={}, payload={}, max_retries=0)
+
+    assert str(excinfo.value) == (
+        "HTTP request failed (HTTP 429). url=https://example.com/hook"
+        " rate_limit_global=True rate_limit_bucket=abc rate_limit_reset_after=2"
+        ' Response: {"retry_after": 2, "global": true}'
+    )
+
+
+def test_retry_sleep_uses_decorrelated_jitter_above_retry_after():
+    mod = _load_discord_module("_http")
+    rl = mod.DiscordRateLimitInfo(retry_after=1.0, is_global=False, bucket=None, remaining=None, reset_after=None)
+
+    for attempt in (1, 2, 3):
+        sleep_s = mod._retry_sleep_s(
+            rl,
+            attempt=attempt,
+            started_at=mod.time.monotonic(),
+            max_retry_after_s=60.0,
+            jitter_s=0,
+            retry_budget_s=120.0,
+        )
+        assert 1.0 <= sleep_s <= 2 ** (attempt - 1)
+
+
+def test_post_json_passes_caller_headers_through(monkeypatch):
+    mod = _load_discord_module("_http")
+    session = FakeSession([FakeResp(204)])
+    monkeypatch.setattr(mod, "_SESSION", session)
+    headers = {"Content-Type": "application/json", "User-Agent": "test"}
+
+    mod.post_json(url="https://example.com/hook", headers=headers, payload={"content": "hi"})
+
+    assert session.calls[0]["headers"] is headers
+
+
+def test_post_json_batch_preserves_input_order(monkeypatch):
+    mod = _load_discord_module("_http")
+
+    class EchoSession:
+        def post(self, url, headers=None, data=None, timeout=None, stream=False):
+            return FakeResp(200, data)
+
+    monkeypatch.setattr(mod, "_SESSION", EchoSession())
+
+    payloads = [{"content": str(i)} for i in range(5)]
+    results = asyncio.run(
+        mod.post_json_batch(url="https://example.com/hook", headers={}, payloads=payloads, concurrency=2)
+    )
+
+    assert results == payloads
+
+
+def test_post_json_batch_keeps_results_when_one_post_fails(monkeypatch, capsys):
+    mod = _load_discord_module("_http")
+    session = FakeSession([FakeResp(200, b'{"id": "1"}'), FakeResp(400, b"bad"), FakeResp(200, b'{"id": "3"}')])
+    monkeypatch.setattr(mod, "_SESSION", session)
+
+    payloads = [{"content": str(i)} for i in range(3)]
+    results = asyncio.run(mod.post_json_batch(url="https://example.com/hook", headers={}, payloads=payloads))
+
+    assert [json.loads(c["data"]) for c in session.calls] == payloads  # In order by default.
+    assert results[0] == {"id": "1"} and results[2] == {"id": "3"}
+    assert isinstance(results[1], mod.DiscordHTTPError)
+
+    assert mod.print_batch_results(results) == 1
+    out, err = capsys.readouterr()
+    assert [r.get("id") for r in json.loads(out)] == ["1", None, "3"]
+    assert "Message 2 failed" in err
+
+
+def test_parse_rate_limit_info_falls_back_through_sources():
+    mod = _load_discord_module("_http")
+    parse = mod._parse_rate_limit_info
+
+    assert parse(status_code=200, headers={"Retry-After": "1"}, body=b"not json") is None
+
+    rl = parse(status_code=429, headers={"Retry-After": "2"}, body=b'{"retry_after": "1.5", "global": true}')
+    assert rl.retry_after == 1.5
+    assert rl.is_global is True
+
+    rl = parse(
+        status_code=429,
+        headers={"Retry-After": "soon", "X-RateLimit-Reset-After": "3.25", "X-RateLimit-Bucket": "b"},
+        body=b'{"retry_after": null}',
+    )
+    assert rl.retry_after == 3.25
+    assert rl.is_global is False
+    assert rl.bucket == "b"
+    assert rl.reset_after == "3.25"
+
+    assert parse(status_code=429, headers={}, body=b'["not", "a", "dict"]') is None
+
+
+def test_rate_limit_gate_holds_waiters_until_the_latest_deadline():
+    mod = _load_discord_module("_http")
+    gate = mod.RateLimitGate()
+    gate.hold(0.2)
+    gate.hold(0.05)
+
+    async def _wait_all():
+        started = time.monotonic()
+        await asyncio.gather(gate.wait(), gate.wait())
+        return time.monotonic() - started
+
+    assert asyncio.run(_wait_all()) >= 0.2
+
+
+def test_sanitize_url_for_logs_redacts_webhook_token():
+    mod = _load_discord_module("_http")
+
+    assert (
+        mod._sanitize_url_for_logs("https://discord.com/api/webhooks/123/s3cr3t?wait=true")
+        == "https://discord.com/api/webhooks/123/[redacted]?wait=true"
+    )
+    assert (
+        mod._sanitize_url_for_logs("https://discord.com/api/webhooks/123/s3cr3t/messages/9")
+        == "https://discord.com/api/webhooks/123/[redacted]/messages/9"
+    )
+    assert mod._sanitize_url_for_logs("https://discord.com/api/v10/channels/1/messages") == (
+        "https://discord.com/api/v10/channels/1/messages"
+    )
+
+
+def test_redacted_errors_do_not_leak_webhook_token(monkeypatch):
+    mod = _load_discord_module("_http")
+    monkeypatch.setattr(mod, "_SESSION", FakeSession([FakeResp(404, b'{"message": "Unknown Webhook"}')]))
+
+    with pytest.raises(mod.DiscordHTTPError) as excinfo:
+        mod.post_json(
+            url="https://discord.com/api/webhooks/123/s3cr3t",
+            headers={},
+            payload={"content": "hi"},
+            redact_url_in_errors=True,
+        )
+
+    assert "s3cr3t" not in str(excinfo.value)
+    assert "url=https://discord.com/api/webhooks/123/[redacted]" in str(excinfo.value)
+
+
+def test_with_wait_param_appends_or_rewrites_query():
+    mod = _load_discord_module("post_webhook")
+    with_wait = mod._with_wait_param
+
+    assert with_wait("https://d.com/api/webhooks/1/t", wait=False) == "https://d.com/api/webhooks/1/t"
+    assert with_wait("https://d.com/api/webhooks/1/t", wait=True) == "https://d.com/api/webhooks/1/t?wait=true"
+    assert with_wait("https://d.com/api/webhooks/1/t?thread_id=9", wait=True) == (
+        "https://d.com/api/webhooks/1/t?thread_id=9&wait=true"
+    )
+    assert with_wait("https://d.com/api/webhooks/1/t?wait=false", wait=True) == (
+        "https://d.com/api/webhooks/1/t?wait=true"
+    )
+    assert with_wait("https://d.com/api/webhooks/1/t#frag", wait=True) == (
+        "https://d.com/api/webhooks/1/t?wait=true#frag"
+    )
+
+
+def test_idempotent_posts_are_served_from_cache_on_rerun(monkeypatch, tmp_path):
+    http = _load_discord_module("_http")
+    mod = _load_discord_module("post_webhook")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    session = FakeSession([FakeResp(200, b'{"id": "1"}'), FakeResp(200, b'{"id": "2"}')])
+    monkeypatch.setattr(http, "_SESSION", session)
+
+    url = "https://discord.com/api/webhooks/123/s3cr3t"
+    payload = mod._payload("deployed")
+
+    assert mod._request_json(url, payload, wait=True, max_retries=0, idempotent=True) == {"id": "1"}
+    assert mod._request_json(url, payload, wait=True, max_retries=0, idempotent=True) == {"id": "1"}
+    assert len(session.calls) == 1
+
+    # Without --idempotent every call reaches Discord.
+    assert mod._request_json(url, payload, wait=True, max_retries=0) == {"id": "2"}
+    assert len(session.calls) == 2
+
+    cached = list((tmp_path / "openhands-discord" / "webhook").iterdir())
+    assert len(cached) == 1
+    assert "s3cr3t" not in cached[0].name
+
+
+def test_idempotent_batch_caches_delivered_posts_even_when_one_fails(monkeypatch, tmp_path):
+    http = _load_discord_module("_http")
+    mod = _load_discord_module("post_webhook")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    session = FakeSession([FakeResp(200, b'{"id": "1"}'), FakeResp(400, b"bad"), FakeResp(200, b'{"id": "3"}')])
+    monkeypatch.setattr(http, "_SESSION", session)
+
+    url = "https://discord.com/api/webhooks/123/s3cr3t"
+    payloads = [mod._payload(c) for c in ("a", "b", "c")]
+
+    first = mod._request_json_batch(url, payloads, wait=True, max_retries=0, concurrency=1, idempotent=True)
+    assert isinstance(first[1], http.DiscordHTTPError)
+
+    # The rerun only re-sends the message that failed.
+    session.responses = [FakeResp(200, b'{"id": "2"}')]
+    second = mod._request_json_batch(url, payloads, wait=True, max_retries=0, concurrency=1, idempotent=True)
+    assert second == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    assert len(session.calls) == 4
+
+
+def test_message_payload_encodes_like_the_dict_form():
+    mod = _load_discord_module("_http")
+    payload = mod.MessagePayload(content="hi")
+    expected = {"content": "hi", "allowed_mentions": {"parse": []}}
+
+    assert json.loads(mod.json_dumps(payload)) == expected
+    assert json.loads(mod.json_dumps(mod.MessagePayload(content="hi", allowed_mentions=mod.ALL_MENTIONS))) == {
+        "content": "hi",
+        "allowed_mentions": {"parse": ["everyone", "roles", "users"]},
+    }
+
+
+def test_urllib_backend_returns_status_headers_and_body():
+    mod = _load_discord_module("_http")
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            status = 200 if self.path == "/ok" else 429
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            return None
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        ok = mod._post_urllib(url=f"{base}/ok", headers={}, data=b'{"a":1}', timeout_s=5)
+        limited = mod._post_urllib(url=f"{base}/limited", headers={}, data=b'{"b":2}', timeout_s=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert (ok.status_code, ok.content) == (200, b'{"a":1}')
+    assert (limited.status_code, limited.content) == (429, b'{"b":2}')
+    assert limited.headers.get("retry-after") == "1"
+
+
+def test_format_json_is_indented_and_sorted():
+    mod = _load_discord_module("_http")
+
+    assert mod.format_json({"b": 1, "a": [1]}) == '{\n  "a": [\n    1\n  ],\n  "b": 1\n}'
+
+
+def test_print_json_writes_pretty_json_with_trailing_newline(capsys):
+    mod = _load_discord_module("_http")
+
+    mod.print_json({"b": "é", "a": 1})
+
+    assert capsys.readouterr().out == '{\n  "a": 1,\n  "b": "é"\n}\n'
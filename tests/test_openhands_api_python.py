@@ -1,7 +1,11 @@
 import importlib.util
+import json
 import sys
+import zipfile
 from pathlib import Path
 
+import pytest
+
 
 def _load_openhands_api_module():
     skill_path = Path(__file__).parent.parent / "skills" / "openhands-api" / "scripts" / "openhands_api.py"
@@ -12,35 +16,87 @@ def _load_openhands_api_module():
     return mod
 
 
-def test_app_conversation_start_builds_v1_payload(monkeypatch):
-    mod = _load_openhands_api_module()
-    OpenHandsAPI = mod.OpenHandsAPI
+class FakeResp:
+    def __init__(self, data=None, *, status_code=200, headers=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(data).encode()
 
-    captured = {}
+    def raise_for_status(self):
+        return None
 
-    class FakeResp:
-        def raise_for_status(self):
-            return None
+    def json(self):
+        return self.data
 
-        def json(self):
-            return {"id": "task-1", "status": "WORKING"}
 
-    class FakeClient:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
+class FakeClient:
+    """Stands in for httpx.Client: records each request and answers via `respond`."""
 
-        def post(self, url, json=None, timeout=None):
-            captured["url"] = url
-            captured["json"] = json
-            captured["timeout"] = timeout
-            return FakeResp()
+    def __init__(self, respond, **kwargs):
+        self.kwargs = kwargs
+        self.respond = respond
+        self.calls = []
+        self.closed = False
 
-        def close(self):
-            return None
+    def _request(self, method, url, kwargs):
+        self.calls.append((method, url, kwargs))
+        result = self.respond(method, url, kwargs)
+        return result if isinstance(result, FakeResp) else FakeResp(result)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, kwargs)
+
+    def stream(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.respond(method, url, kwargs)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeHTTP:
+    def __init__(self, mod):
+        self.mod = mod
+        self.clients = []
+        self.respond = lambda method, url, kwargs: None
+
+    def client(self, **kwargs):
+        client = FakeClient(lambda *args: self.respond(*args), **kwargs)
+        self.clients.append(client)
+        return client
+
+    @property
+    def calls(self):
+        return [call for client in self.clients for call in client.calls]
 
-    monkeypatch.setattr(mod.httpx, "Client", lambda **kwargs: FakeClient(**kwargs))
 
-    api = OpenHandsAPI(api_key="k", base_url="https://example.com/")
+@pytest.fixture(scope="module")
+def mod():
+    return _load_openhands_api_module()
+
+
+@pytest.fixture
+def fake_http(monkeypatch, mod):
+    """Replace httpx.Client for code paths that build their own clients (agent servers, CLI)."""
+    fake = FakeHTTP(mod)
+    monkeypatch.setattr(mod.httpx, "Client", fake.client)
+    return fake
+
+
+def _api(mod, respond=None, **kwargs):
+    """An OpenHandsAPI whose app-server client is an injected FakeClient."""
+    client = FakeClient(respond or (lambda method, url, kwargs: None))
+    api = mod.OpenHandsAPI(api_key="k", base_url="https://example.com", client=client, **kwargs)
+    return api, client
+
+
+def test_app_conversation_start_builds_v1_payload(mod):
+    client = FakeClient(lambda method, url, kwargs: {"id": "task-1", "status": "WORKING"})
+    api = mod.OpenHandsAPI(api_key="k", base_url="https://example.com/", client=client)
     resp = api.app_conversation_start(
         initial_message="hi",
         selected_repository="o/r",
@@ -50,9 +106,10 @@ def test_app_conversation_start_builds_v1_payload(monkeypatch):
     )
 
     assert resp == {"id": "task-1", "status": "WORKING"}
-    assert captured["url"] == "https://example.com/api/v1/app-conversations"
-    assert captured["timeout"] == 120
-    assert captured["json"] == {
+    ((method, url, kwargs),) = client.calls
+    assert (method, url) == ("POST", "https://example.com/api/v1/app-conversations")
+    assert kwargs["timeout"] == 120
+    assert kwargs["json"] == {
         "initial_message": {
             "role": "user",
             "content": [{"type": "text", "text": "hi"}],
@@ -64,89 +121,328 @@ def test_app_conversation_start_builds_v1_payload(monkeypatch):
     }
 
 
-def test_app_conversations_get_batch_passes_ids(monkeypatch):
-    mod = _load_openhands_api_module()
-    OpenHandsAPI = mod.OpenHandsAPI
+def test_app_conversations_get_batch_passes_ids(mod):
+    api, client = _api(mod, lambda method, url, kwargs: [{"id": "conv-1"}])
+    conversations = api.app_conversations_get_batch(ids=["conv-1", "conv-2"])
+
+    assert conversations == [{"id": "conv-1"}]
+    ((_, url, kwargs),) = client.calls
+    assert url == "https://example.com/api/v1/app-conversations"
+    assert kwargs["params"] == {"ids": ["conv-1", "conv-2"]}
+
+
+def test_poll_start_task_until_ready_uses_start_task_endpoint(mod, monkeypatch):
+    states = [
+        {"id": "task-1", "status": "WORKING"},
+        {"id": "task-1", "status": "READY", "app_conversation_id": "conv-1"},
+    ]
+    sleeps = []
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    api, client = _api(mod, lambda method, url, kwargs: [states.pop(0)])
+    ready = api.poll_start_task_until_ready("task-1", timeout_s=10, poll_interval_s=0.01, backoff_factor=1.0)
+
+    assert ready == {"id": "task-1", "status": "READY", "app_conversation_id": "conv-1"}
+    assert len(sleeps) == 1
+    assert {url for _, url, _ in client.calls} == {"https://example.com/api/v1/app-conversations/start-tasks"}
+
+
+def test_legacy_alias_still_exists(mod):
+    api = mod.OpenHandsV1API(api_key="k", client=FakeClient(None))
+    assert isinstance(api, mod.OpenHandsAPI)
+
+
+def test_client_is_pooled_and_closed_by_context_manager(mod, fake_http):
+    with mod.OpenHandsAPI(api_key="k") as api:
+        assert isinstance(api, mod.OpenHandsAPI)
+
+    (client,) = fake_http.clients
+    assert client.closed
+    assert client.kwargs["limits"] is mod.APP_SERVER_LIMITS
+    assert "transport" not in client.kwargs  # A custom transport would disable env proxies.
+
+    injected = FakeClient(None)
+    with mod.OpenHandsAPI(api_key="k", client=injected):
+        pass
+    assert not injected.closed  # Callers own the clients they pass in.
+
+
+def test_clients_honor_proxy_environment(mod, monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+
+    with mod.OpenHandsAPI(api_key="k") as api:
+        agent = api._agent_client("https://agent.example")
+        assert api._client._mounts
+        assert agent._mounts
+
+
+def test_poll_start_tasks_until_ready_batches_pending_ids(mod, monkeypatch):
+    rounds = [
+        [{"id": "t1", "status": "READY"}, {"id": "t2", "status": "WORKING"}],
+        [{"id": "t2", "status": "ERROR"}],
+    ]
+    requested = []
+
+    def respond(method, url, kwargs):
+        requested.append(list(kwargs["params"]["ids"]))
+        return rounds.pop(0)
+
+    monkeypatch.setattr(mod.time, "sleep", lambda *_args, **_kwargs: None)
+
+    api, _ = _api(mod, respond)
+    done = api.poll_start_tasks_until_ready(["t1", "t2"], timeout_s=10)
+
+    assert requested == [["t1", "t2"], ["t2"]]
+    assert list(done) == ["t1", "t2"]
+    assert done["t2"]["status"] == "ERROR"
+
+
+def test_poll_start_task_backoff_resets_when_status_changes(mod, monkeypatch):
+    statuses = ["WORKING", "WORKING", "STARTING_SANDBOX", "WORKING", "READY"]
+    sleeps = []
+
+    api = mod.OpenHandsAPI.__new__(mod.OpenHandsAPI)
+    monkeypatch.setattr(
+        api,
+        "app_conversations_start_tasks_get_batch",
+        lambda *, ids: [{"id": ids[0], "status": statuses.pop(0)}],
+        raising=False,
+    )
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+    monkeypatch.setattr(mod.random, "uniform", lambda a, b: 0.0)
+
+    api.poll_start_task_until_ready("t1", poll_interval_s=1.0, backoff_factor=2.0, max_interval_s=8.0)
+
+    # 1 -> 2 grows while unchanged, then drops back to 1 after each transition.
+    assert sleeps == [1.0, 2.0, 1.0, 1.0]
+
+
+def test_iter_conversation_events_follows_next_page_id(mod):
+    pages = {
+        None: {"items": [{"id": "e1"}, {"id": "e2"}], "next_page_id": "p2"},
+        "p2": {"items": [{"id": "e3"}], "next_page_id": None},
+    }
+    api, client = _api(mod, lambda method, url, kwargs: pages[kwargs["params"].get("page_id")])
+    events = list(api.iter_conversation_events("conv-1", page_size=2))
+
+    assert [e["id"] for e in events] == ["e1", "e2", "e3"]
+    assert [kwargs["params"] for _, _, kwargs in client.calls] == [{"limit": 2}, {"limit": 2, "page_id": "p2"}]
+
 
+def test_app_conversation_download_zip_streams_to_disk(mod, tmp_path):
     captured = {}
 
-    class FakeResp:
+    class FakeStream:
+        headers = {"content-type": "application/zip"}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
         def raise_for_status(self):
             return None
 
-        def json(self):
-            return [{"id": "conv-1"}]
+        def iter_bytes(self, chunk_size=None):
+            captured["chunk_size"] = chunk_size
+            yield b"PK"
+            yield b"\x03\x04"
+
+    api, client = _api(mod, lambda method, url, kwargs: FakeStream())
+    out = tmp_path / "conv.zip"
+    meta = api.app_conversation_download_zip("conv-1", output_file=out)
+
+    ((method, url, _),) = client.calls
+    assert (method, url) == ("GET", "https://example.com/api/v1/app-conversations/conv-1/download")
+    assert captured["chunk_size"] == mod.DOWNLOAD_CHUNK_SIZE
+    assert out.read_bytes() == b"PK\x03\x04"
+    assert meta == {"file": str(out), "size": 4, "content_type": "application/zip"}
+
+
+def test_count_events_via_trajectory_zip_counts_without_extracting(mod, monkeypatch, tmp_path):
+    def fake_download(self, app_conversation_id, *, output_file):
+        with zipfile.ZipFile(output_file, "w") as zf:
+            zf.writestr("meta.json", "{}")
+            zf.writestr("event_000001_abc.json", "{}")
+            zf.writestr("event_000002_def.json", "{}")
+            zf.writestr("nested/event_000003.json", "{}")
+        return {"file": str(output_file)}
+
+    monkeypatch.setattr(mod.OpenHandsAPI, "app_conversation_download_zip", fake_download)
+
+    api, _ = _api(mod)
+    extract_dir = tmp_path / "out"
+    summary = api.count_events_via_trajectory_zip(
+        "conv-1", zip_file=tmp_path / "t.zip", extract_dir=extract_dir, count_only=True
+    )
 
-    class FakeClient:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
+    assert summary["event_count"] == 2
+    assert summary["has_meta"] is True
+    assert summary["extract_dir"] is None
+    assert not extract_dir.exists()
 
-        def get(self, url, params=None):
-            captured["url"] = url
-            captured["params"] = params
-            return FakeResp()
+    summary = api.count_events_via_trajectory_zip("conv-1", zip_file=tmp_path / "t.zip", extract_dir=extract_dir)
+    assert summary["event_count"] == 2
+    assert (extract_dir / "event_000001_abc.json").exists()
 
-        def close(self):
-            return None
 
-    monkeypatch.setattr(mod.httpx, "Client", lambda **kwargs: FakeClient(**kwargs))
+def test_agent_headers_are_shared_and_read_only(mod):
+    first = mod.OpenHandsAPI._shared_agent_headers("sk")
+    assert first is mod.OpenHandsAPI._shared_agent_headers("sk")
+    assert dict(first) == mod.OpenHandsAPI.agent_headers("sk")
+    with pytest.raises(TypeError):
+        first["X-Session-API-Key"] = "other"
 
-    api = OpenHandsAPI(api_key="k", base_url="https://example.com")
-    conversations = api.app_conversations_get_batch(ids=["conv-1", "conv-2"])
 
-    assert conversations == [{"id": "conv-1"}]
-    assert captured["url"] == "https://example.com/api/v1/app-conversations"
-    assert captured["params"] == {"ids": ["conv-1", "conv-2"]}
+def test_agent_server_calls_reuse_one_client_per_server(mod, fake_http):
+    fake_http.respond = lambda method, url, kwargs: 7
 
+    api = mod.OpenHandsAPI(api_key="k", base_url="https://example.com")
+    for url in ("https://sandbox.example/", "https://sandbox.example"):
+        count = api.agent_events_count(agent_server_url=url, session_api_key="sk", conversation_id="c1")
+        assert count == 7
 
-def test_poll_start_task_until_ready_uses_start_task_endpoint(monkeypatch):
-    mod = _load_openhands_api_module()
-    OpenHandsAPI = mod.OpenHandsAPI
+    app_client, agent_client = fake_http.clients
+    assert agent_client.kwargs["base_url"] == "https://sandbox.example"
+    assert [path for _, path, _ in agent_client.calls] == ["/api/conversations/c1/events/count"] * 2
 
-    states = [
-        {"id": "task-1", "status": "WORKING"},
-        {"id": "task-1", "status": "READY", "app_conversation_id": "conv-1"},
+    api.close()
+    assert app_client.closed and agent_client.closed
+
+
+def test_static_lookups_are_cached_but_conversations_are_not(mod):
+    def respond(method, url, kwargs):
+        if url.endswith("/users/me"):
+            return {"id": "u1"}
+        return [{"id": kwargs["params"]["ids"][0], "execution_status": "finished", "sandbox_status": "RUNNING"}]
+
+    api, client = _api(mod, respond)
+    me = api.users_me()
+    me["id"] = "mutated"
+    assert api.users_me() == {"id": "u1"}  # Each hit is a fresh copy.
+    assert len(client.calls) == 1
+
+    # Even finished conversations are re-fetched: their sandbox can be paused or resumed.
+    api.app_conversation_get("done")
+    api.app_conversation_get("done")
+    assert len(client.calls) == 3
+
+    api.invalidate()
+    api.users_me()
+    assert len(client.calls) == 4
+
+
+def test_get_batch_chunks_long_id_lists_and_keeps_order(mod):
+    api, client = _api(mod, lambda method, url, kwargs: [{"id": i} for i in kwargs["params"]["ids"]])
+    ids = [f"c{i}" for i in range(120)]
+    items = api.app_conversations_get_batch(ids=ids)
+
+    assert [item["id"] for item in items] == ids
+    assert sorted(len(kwargs["params"]["ids"]) for _, _, kwargs in client.calls) == [20, 50, 50]
+
+
+def test_json_helpers_work_with_and_without_orjson(mod, monkeypatch):
+    expected = {"items": [{"id": "é"}]}
+    resp = FakeResp(expected)
+    assert mod._decode_json(resp) == expected
+    assert json.loads(mod._format_json(expected)) == expected
+
+    monkeypatch.setattr(mod, "orjson", None)
+    assert mod._decode_json(resp) == expected
+    assert mod._format_json({"a": 1}) == '{\n  "a": 1\n}'
+
+
+def test_iter_agent_events_follows_cursor_and_keeps_filters(mod, fake_http):
+    pages = {
+        None: {"items": [{"id": "a"}], "next_page_id": "p2"},
+        "p2": {"items": [{"id": "b"}, {"id": "c"}]},
+    }
+    fake_http.respond = lambda method, url, kwargs: pages[kwargs["params"].get("page_id")]
+
+    api = mod.OpenHandsAPI(api_key="k", base_url="https://example.com")
+    events = api.iter_agent_events(
+        agent_server_url="https://sandbox.example",
+        session_api_key="sk",
+        conversation_id="c1",
+        kind="ActionEvent",
+    )
+
+    assert [e["id"] for e in events] == ["a", "b", "c"]
+    assert [kwargs["params"] for _, _, kwargs in fake_http.calls] == [
+        {"limit": 100, "kind": "ActionEvent"},
+        {"limit": 100, "page_id": "p2", "kind": "ActionEvent"},
     ]
-    call_count = {"sleep": 0}
 
-    class FakeClient:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
 
-        def get(self, url, params=None):
-            class FakeResp:
-                def raise_for_status(self_nonlocal):
-                    return None
+def test_start_from_prompt_files_appends_optional_tail(mod, monkeypatch, tmp_path):
+    sent = []
+    monkeypatch.setattr(
+        mod.OpenHandsAPI, "app_conversation_start", lambda self, **kwargs: sent.append(kwargs["initial_message"])
+    )
 
-                def json(self_nonlocal):
-                    return [states.pop(0)]
+    prompt = tmp_path / "prompt.md"
+    prompt.write_text("main", encoding="utf-8")
+    tail = tmp_path / "tail.md"
+    tail.write_text("extra", encoding="utf-8")
 
-            return FakeResp()
+    api, _ = _api(mod)
+    api.app_conversation_start_from_prompt_files(prompt, append_file=tail)
+    api.app_conversation_start_from_prompt_files(prompt, append_file=tmp_path / "missing.md")
 
-        def close(self):
-            return None
+    assert sent == ["main\n\nextra", "main"]
 
-    monkeypatch.setattr(mod.httpx, "Client", lambda **kwargs: FakeClient(**kwargs))
-    monkeypatch.setattr(mod.time, "sleep", lambda *_args, **_kwargs: call_count.__setitem__("sleep", call_count["sleep"] + 1))
 
-    api = OpenHandsAPI(api_key="k", base_url="https://example.com")
-    ready = api.poll_start_task_until_ready("task-1", timeout_s=10, poll_interval_s=0.01, backoff_factor=1.0)
+def test_app_conversation_get_revalidates_with_etag(mod):
+    etag = {"etag": 'W/"v1"'}
 
-    assert ready == {"id": "task-1", "status": "READY", "app_conversation_id": "conv-1"}
-    assert call_count["sleep"] == 1
+    def respond(method, url, kwargs):
+        if kwargs.get("headers"):
+            return FakeResp(status_code=304, headers=etag)
+        return FakeResp([{"id": "c1", "execution_status": "running"}], headers=etag)
 
+    api, client = _api(mod, respond)
+    first = api.app_conversation_get("c1")
+    second = api.app_conversation_get("c1")
 
-def test_legacy_alias_still_exists(monkeypatch):
-    mod = _load_openhands_api_module()
+    assert first == second == {"id": "c1", "execution_status": "running"}
+    assert first is not second
+    assert [kwargs.get("headers") for _, _, kwargs in client.calls] == [None, {"If-None-Match": 'W/"v1"'}]
 
-    class FakeClient:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
 
-        def close(self):
-            return None
+def test_start_conversations_batch_cli_starts_each_prompt_file(mod, fake_http, tmp_path, capsys):
+    def respond(method, url, kwargs):
+        return {"id": f"task-{len(fake_http.calls)}"}
 
-    monkeypatch.setattr(mod.httpx, "Client", lambda **kwargs: FakeClient(**kwargs))
+    fake_http.respond = respond
+    for name, text in (("b.md", "second"), ("a.md", "first"), ("notes.txt", "ignored")):
+        (tmp_path / name).write_text(text, encoding="utf-8")
 
-    api = mod.OpenHandsV1API(api_key="k")
-    assert isinstance(api, mod.OpenHandsAPI)
+    rc = mod.main(
+        ["start-conversations-batch", "--api-key", "k", "--prompt-dir", str(tmp_path), "--concurrency", "2"]
+    )
+
+    assert rc == 0
+    started = [kwargs["json"]["initial_message"]["content"][0]["text"] for _, _, kwargs in fake_http.calls]
+    assert sorted(started) == ["first", "second"]
+    results = json.loads(capsys.readouterr().out)
+    assert [Path(r["prompt_file"]).name for r in results] == ["a.md", "b.md"]
+
+
+def test_start_conversations_batch_cli_reports_bad_prompt_files_in_place(mod, fake_http, tmp_path, capsys):
+    fake_http.respond = lambda method, url, kwargs: {"id": "task"}
+    (tmp_path / "a.md").write_text("first", encoding="utf-8")
+    (tmp_path / "b.md").write_bytes(b"\xff\xfe not utf-8")
+    (tmp_path / "c.md").write_text("third", encoding="utf-8")
+
+    rc = mod.main(["start-conversations-batch", "--api-key", "k", "--prompt-dir", str(tmp_path)])
+
+    assert rc == 1
+    assert len(fake_http.calls) == 2
+    results = json.loads(capsys.readouterr().out)
+    assert [("start_task" in r, Path(r["prompt_file"]).name) for r in results] == [
+        (True, "a.md"),
+        (False, "b.md"),
+        (True, "c.md"),
+    ]
+    assert results[1]["error"].startswith("UnicodeDecodeError")
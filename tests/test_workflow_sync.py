@@ -12,21 +12,26 @@ def test_workflow_files_are_in_sync():
     if not workflows_dir.exists():
         return  # No workflows directory
 
+    # Read each canonical workflow once, however many plugins carry a copy of it.
+    canonical_bytes = {
+        f.name: f.read_bytes()
+        for pattern in ("*.yml", "*.yaml")
+        for f in workflows_dir.glob(pattern)
+    }
+
     mismatches = []
-    # Check all plugins/*/workflows/ directories
+    # Only plugins/*/workflows/ can hold copies, so look there instead of walking the repo.
     for copy_path in repo_root.glob("plugins/*/workflows"):
         if not copy_path.is_dir():
             continue
 
-        for copy_file in copy_path.glob("*.yml"):
-            canonical_file = workflows_dir / copy_file.name
-            if not canonical_file.exists():
+        for copy_file in (f for pattern in ("*.yml", "*.yaml") for f in copy_path.glob(pattern)):
+            canonical = canonical_bytes.get(copy_file.name)
+            if canonical is None:
                 continue
 
-            canonical_content = canonical_file.read_text()
-            copy_content = copy_file.read_text()
-
-            if canonical_content != copy_content:
+            # Compare raw bytes, and skip reading the copy when its size already differs.
+            if copy_file.stat().st_size != len(canonical) or copy_file.read_bytes() != canonical:
                 rel_path = copy_path.relative_to(repo_root)
                 mismatches.append(
                     f"{rel_path}/{copy_file.name} differs from "